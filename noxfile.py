@@ -15,7 +15,28 @@ def test(session: nox.Session) -> None:
 
     install_spec = "-e.[test]"
     session.install(install_spec)
-    session.run("pytest", *posargs, env=env)
+    session.run("pytest", "-n", "auto", "--dist", "loadgroup", *posargs, env=env)
+
+
+@nox.session(python=_python_sessions)
+def test_slow(session: nox.Session) -> None:
+    posargs = list(session.posargs)
+    env = os.environ.copy()
+
+    install_spec = "-e.[test]"
+    session.install(install_spec)
+    session.run(
+        "pytest",
+        "-n",
+        "auto",
+        "--dist",
+        "loadgroup",
+        "--run-slow",
+        "-m",
+        "slow",
+        *posargs,
+        env=env,
+    )
 
 
 @nox.session(python=_python_sessions)
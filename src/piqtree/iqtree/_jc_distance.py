@@ -29,11 +29,11 @@ def _dists_to_distmatrix(
         Pairwise distance matrix.
 
     """
-    dist_dict = {}
-    for i in range(1, len(distances)):
-        for j in range(i):
-            dist_dict[(names[i], names[j])] = distances[i, j]
-    return DistanceMatrix(dist_dict)
+    # symmetrise from the lower triangle, with names in sorted order
+    lower = np.tril(distances, -1)
+    order = np.argsort(names)
+    symmetric = (lower + lower.T)[np.ix_(order, order)]
+    return DistanceMatrix.from_array_names(symmetric, [names[i] for i in order])
 
 
 def jc_distances(
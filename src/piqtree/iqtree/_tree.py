@@ -51,6 +51,7 @@ def _process_tree_yaml(
     tree_yaml: dict[str, Any],
     names: Sequence[str],
     model: Model,
+    model_str: str | None = None,
 ) -> PhyloNode:
     newick = tree_yaml["PhyloTree"]["newick"]
 
@@ -78,7 +79,7 @@ def _process_tree_yaml(
     _rename_iq_tree(tree, names)
 
     tree.name_unnamed_nodes()
-    tree.params["model"] = str(model)
+    tree.params["model"] = str(model) if model_str is None else model_str
 
     return tree
 
@@ -134,6 +135,7 @@ def build_tree(
 
     if isinstance(model, str):
         model = make_model(model)
+    model_str = str(model)
 
     rand_seed = process_rand_seed_nonzero(rand_seed)
 
@@ -150,14 +152,14 @@ def build_tree(
         iq_build_tree(
             names,
             seqs,
-            str(model),
+            model_str,
             rand_seed,
             bootstrap_replicates,
             num_threads,
             other_options,
         ),
     )
-    return _process_tree_yaml(yaml_result, names, model)
+    return _process_tree_yaml(yaml_result, names, model, model_str)
 
 
 INVALID_FIT_TREE_PARAMS = [
@@ -214,6 +216,7 @@ def fit_tree(
 
     if isinstance(model, str):
         model = make_model(model)
+    model_str = str(model)
 
     if num_threads is None:
         num_threads = 1
@@ -226,7 +229,7 @@ def fit_tree(
         iq_fit_tree(
             names,
             seqs,
-            str(model),
+            model_str,
             newick,
             bl_fixed,
             0,
@@ -234,7 +237,7 @@ def fit_tree(
             other_options,
         ),
     )
-    return _process_tree_yaml(yaml_result, names, model)
+    return _process_tree_yaml(yaml_result, names, model, model_str)
 
 
 def nj_tree(
@@ -262,14 +265,12 @@ def nj_tree(
     jc_distances : construction of pairwise JC distance matrix from alignment.
 
     """
-    if np.isnan(pairwise_distances.array).any():
+    distances = np.ascontiguousarray(pairwise_distances.array, dtype=float)
+    if np.isnan(distances).any():
         msg = "The pairwise distance matrix cannot contain NaN values."
         raise ValueError(msg)
 
-    newick_tree = iq_nj_tree(
-        pairwise_distances.keys(),
-        np.array(pairwise_distances).flatten(),
-    )
+    newick_tree = iq_nj_tree(pairwise_distances.keys(), distances.ravel())
 
     tree = make_tree(newick_tree)
 
@@ -1,8 +1,8 @@
-import contextlib
-import functools
 from collections.abc import Sequence
 from enum import Enum, unique
 
+from piqtree.model._substitution_model import _store_descriptions
+
 
 @unique
 class FreqType(Enum):
@@ -12,14 +12,7 @@ class FreqType(Enum):
     FO = "FO"
     FQ = "FQ"
 
-    @staticmethod
-    @functools.cache
-    def _descriptions() -> dict["FreqType", str]:
-        return {
-            FreqType.F: "Empirical state frequency observed from the data.",
-            FreqType.FO: "State frequency optimized by maximum-likelihood from the data. Note that this is with letter-O and not digit-0.",
-            FreqType.FQ: "Equal state frequency.",
-        }
+    _description: str
 
     @property
     def description(self) -> str:
@@ -31,10 +24,19 @@ class FreqType(Enum):
             The description of the FreqType.
 
         """
-        return self._descriptions()[self]
+        return self._description
 
     def iqtree_str(self) -> str:
-        return self.value
+        return self._value_
+
+
+_FREQ_TYPE_DESCRIPTIONS: dict[FreqType, str] = {
+    FreqType.F: "Empirical state frequency observed from the data.",
+    FreqType.FO: "State frequency optimized by maximum-likelihood from the data. Note that this is with letter-O and not digit-0.",
+    FreqType.FQ: "Equal state frequency.",
+}
+
+_store_descriptions(_FREQ_TYPE_DESCRIPTIONS)
 
 
 class CustomBaseFreq:
@@ -82,14 +84,13 @@ class CustomBaseFreq:
             msg = f"A CustomBaseFreq must start with F but got {base_freq_str!r}."
             raise ValueError(msg)
 
-        if base_freq_str[1] != "{" or base_freq_str[-1] != "}":
+        head, sep, params = base_freq_str.partition("{")
+        if head != "F" or not sep or not params.endswith("}"):
             msg = f"A CustomBaseFreq must be parameterised with {{}} but got {base_freq_str!r}."
             raise ValueError(msg)
 
         try:
-            frequencies = tuple(
-                float(val.strip()) for val in base_freq_str[2:-1].split(",")
-            )
+            frequencies = tuple(map(float, params[:-1].split(",")))
         except ValueError:
             msg = f"Unable to parse parameters for CustomBaseFreq: {base_freq_str!r}."
             raise ValueError(msg) from None
@@ -123,8 +124,9 @@ def get_freq_type(
 
     shortened = base_freq_str.lstrip("+")
 
-    with contextlib.suppress(KeyError):
-        return FreqType[shortened]
+    freq_type = FreqType.__members__.get(shortened)
+    if freq_type is not None:
+        return freq_type
 
     if shortened.startswith("F{"):
         return CustomBaseFreq.from_str(shortened)
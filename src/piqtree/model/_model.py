@@ -1,3 +1,5 @@
+import functools
+
 from piqtree.model._freq_type import CustomBaseFreq, FreqType, get_freq_type
 from piqtree.model._rate_type import RateModel, get_rate_type
 from piqtree.model._substitution_model import SubstitutionModel, get_substitution_model
@@ -118,8 +120,20 @@ def make_model(iqtree_str: str) -> Model:
         The equivalent Model class.
 
     """
+    sub_mod_str, freq_type, rate_model, invariable_sites = _split_model_str(
+        iqtree_str,
+    )
+    return Model(sub_mod_str, freq_type, rate_model, invariable_sites=invariable_sites)
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_model_str(
+    iqtree_str: str,
+) -> tuple[str, str | None, str | None, bool | float]:
+    # Models hold mutable components, so only the string decomposition is
+    # cached and make_model builds a new Model on every call.
     if "+" not in iqtree_str:
-        return Model(iqtree_str)
+        return iqtree_str, None, None, False
 
     sub_mod_str, components = iqtree_str.split("+", maxsplit=1)
 
@@ -151,7 +165,7 @@ def make_model(iqtree_str: str) -> Model:
     if invariable_sites is None:
         invariable_sites = False
 
-    return Model(sub_mod_str, freq_type, rate_model, invariable_sites=invariable_sites)
+    return sub_mod_str, freq_type, rate_model, invariable_sites
 
 
 def _parse_invariable_sites(component: str) -> bool | float:
@@ -1,6 +1,7 @@
 """Convenience functions for showing user facing options and their descriptions."""
 
 import functools
+import itertools
 from typing import Literal
 
 from cogent3.core.table import Table, make_table
@@ -8,7 +9,7 @@ from cogent3.core.table import Table, make_table
 from piqtree.model._freq_type import FreqType
 from piqtree.model._rate_type import ALL_BASE_RATE_TYPES, get_description
 from piqtree.model._substitution_model import (
-    ALL_MODELS_CLASSES,
+    ALL_MODELS,
     AaModel,
     LieModel,
     StandardDnaModel,
@@ -27,16 +28,24 @@ def _make_models(
     }
 
     if model_classes == SubstitutionModel:
-        model_classes = ALL_MODELS_CLASSES
-
-    if isinstance(model_classes, type) and issubclass(model_classes, SubstitutionModel):
-        model_classes = (model_classes,)
+        models = ALL_MODELS
+    else:
+        if isinstance(model_classes, type) and issubclass(
+            model_classes,
+            SubstitutionModel,
+        ):
+            model_classes = (model_classes,)
+
+        models = tuple(
+            itertools.chain.from_iterable(
+                model_class.iter_available_models() for model_class in model_classes
+            ),
+        )
 
-    for model_class in model_classes:
-        for model in model_class.iter_available_models():
-            data["Model Type"].append(model.model_type())
-            data["Abbreviation"].append(model.iqtree_str())
-            data["Description"].append(model.description)
+    for model in models:
+        data["Model Type"].append(model.model_type())
+        data["Abbreviation"].append(model.iqtree_str())
+        data["Description"].append(model.description)
 
     return data
 
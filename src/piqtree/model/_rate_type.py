@@ -57,16 +57,16 @@ class RateType:
             String parsable by IQ-TREE for the rate heterogeneity model.
 
         """
-        rate_type_str = "I" if self.invariable_sites else ""
+        parts = ["I"] if self.invariable_sites else []
         if self.proportion_invariable is not None:
-            rate_type_str += f"{{{self.proportion_invariable}}}"
+            parts.extend(("{", str(self.proportion_invariable), "}"))
 
-        if self.rate_model is None:
-            return rate_type_str
-        # Invariant sites and model need to be joined by a '+'
-        if self.invariable_sites:
-            rate_type_str += "+"
-        return rate_type_str + self.rate_model.iqtree_str()
+        if self.rate_model is not None:
+            # Invariant sites and model need to be joined by a '+'
+            if self.invariable_sites:
+                parts.append("+")
+            parts.append(self.rate_model.iqtree_str())
+        return "".join(parts)
 
     @property
     def name(self) -> str:
@@ -99,14 +99,14 @@ class DiscreteGammaModel(RateModel):
         self.alpha = alpha
 
     def iqtree_str(self) -> str:
-        out_str = "G"
+        parts = ["G"]
 
         if self.rate_categories is not None:
-            out_str += str(self.rate_categories)
+            parts.append(str(self.rate_categories))
 
         if self.alpha is not None:
-            out_str += f"{{{self.alpha}}}"
-        return out_str
+            parts.extend(("{", str(self.alpha), "}"))
+        return "".join(parts)
 
     @classmethod
     def from_str(cls, rate_model_str: str) -> "DiscreteGammaModel":
@@ -121,8 +121,8 @@ class DiscreteGammaModel(RateModel):
         if len(rate_model_str) == 1:
             return cls()
 
-        rate_categories = _parse_rate_categories(rate_model_str)
         parameter_start = rate_model_str.find("{")
+        rate_categories = _parse_rate_categories(rate_model_str, parameter_start)
 
         # If there is no parameterisation
         if parameter_start == -1:
@@ -197,16 +197,17 @@ class FreeRateModel(RateModel):
             self.rates = list(rates)
 
     def iqtree_str(self) -> str:
-        base = "R" if self.rate_categories is None else f"R{self.rate_categories}"
+        parts = ["R"]
 
-        if self.weights is None or self.rates is None:
-            return base
-
-        weights_and_rates = itertools.chain.from_iterable(
-            zip(self.weights, self.rates, strict=True),
-        )
+        if self.rate_categories is not None:
+            parts.append(str(self.rate_categories))
 
-        return f"{base}{{{','.join(str(val) for val in weights_and_rates)}}}"
+        if self.weights is not None and self.rates is not None:
+            weights_and_rates = itertools.chain.from_iterable(
+                zip(self.weights, self.rates, strict=True),
+            )
+            parts.extend(("{", ",".join(map(str, weights_and_rates)), "}"))
+        return "".join(parts)
 
     @classmethod
     def from_str(cls, rate_model_str: str) -> "FreeRateModel":
@@ -221,8 +222,8 @@ class FreeRateModel(RateModel):
         if len(rate_model_str) == 1:
             return cls()
 
-        rate_categories = _parse_rate_categories(rate_model_str)
         parameter_start = rate_model_str.find("{")
+        rate_categories = _parse_rate_categories(rate_model_str, parameter_start)
 
         # If there is no parameterisation
         if parameter_start == -1:
@@ -338,15 +339,12 @@ def get_rate_type(
     )
 
 
-def _parse_rate_categories(rate_model_str: str) -> int | None:
+def _parse_rate_categories(rate_model_str: str, parameters_start: int) -> int | None:
     # Assume that the rate model str starts with a G or an R
-    parameters_start = rate_model_str.find("{")
-
-    # There is no {} style parameterisation
-    if parameters_start == -1:
-        categories_str = rate_model_str[1:]
-    else:
-        categories_str = rate_model_str[1:parameters_start]
+    # parameters_start is the index of the "{" (-1 if there is no {} parameterisation)
+    categories_str = rate_model_str[
+        1 : parameters_start if parameters_start != -1 else len(rate_model_str)
+    ]
 
     if len(categories_str) == 0:
         return None
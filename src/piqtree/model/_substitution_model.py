@@ -1,7 +1,9 @@
-import contextlib
 import functools
+import itertools
+import re
+import sys
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, unique
 from typing import ClassVar, Literal, cast
 
@@ -9,6 +11,8 @@ from typing import ClassVar, Literal, cast
 class SubstitutionModel:
     """Base class for substitution models."""
 
+    __slots__ = ()
+
     @staticmethod
     def model_type() -> str:
         """Get the type of the model.
@@ -93,20 +97,41 @@ class SubstitutionModel:
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
+def _format_model_params(model_params: Sequence[float] | None) -> str:
+    if not model_params:
+        return ""
+    return f"{{{','.join(map(str, model_params))}}}"
+
+
+def _store_descriptions[T](descriptions: dict[T, str]) -> None:
+    # Enum members are singletons, so each keeps its description as an attribute
+    for member, description in descriptions.items():
+        object.__setattr__(member, "_description", description)
+
+
+@dataclass(frozen=True, slots=True)
 class StandardDnaModelInstance(SubstitutionModel):
     dna_model: "StandardDnaModel"
     model_params: Sequence[float] | None = None
+    _iqtree_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.model_params is not None:
+            # Store as a tuple so instances are always hashable
+            object.__setattr__(self, "model_params", tuple(self.model_params))
+
+        object.__setattr__(
+            self,
+            "_iqtree_str",
+            self.dna_model.value + _format_model_params(self.model_params),
+        )
 
     @staticmethod
     def model_type() -> str:
         return "nucleotide"
 
     def iqtree_str(self) -> str:
-        params = (
-            f"{{{','.join(map(str, self.model_params))}}}" if self.model_params else ""
-        )
-        return f"{self.dna_model.value}{params}"
+        return self._iqtree_str
 
     def get_moltype(self) -> Literal["dna", "protein"]:
         return "dna"
@@ -117,15 +142,15 @@ class StandardDnaModelInstance(SubstitutionModel):
 
     @staticmethod
     def iter_available_models() -> Sequence["StandardDnaModel"]:
-        return StandardDnaModel.iter_available_models()
+        return _STANDARD_DNA_MODELS
 
     @staticmethod
     def num_available_models() -> int:
-        return StandardDnaModel.num_available_models()
+        return len(_STANDARD_DNA_MODELS)
 
     @property
     def description(self) -> str:
-        return StandardDnaModel._descriptions()[self.dna_model]  # noqa: SLF001
+        return self.dna_model.description
 
 
 @unique
@@ -162,6 +187,8 @@ class StandardDnaModel(SubstitutionModel, Enum):
     STRSYM = "STRSYM"
     UNREST = "UNREST"
 
+    _description: str
+
     def __call__(
         self,
         model_params: Sequence[float] | None = None,
@@ -188,7 +215,7 @@ class StandardDnaModel(SubstitutionModel, Enum):
         return "nucleotide"
 
     def iqtree_str(self) -> str:
-        return self.value
+        return self._value_
 
     def get_moltype(self) -> Literal["dna", "protein"]:
         return "dna"
@@ -199,60 +226,62 @@ class StandardDnaModel(SubstitutionModel, Enum):
 
     @staticmethod
     def iter_available_models() -> Sequence["StandardDnaModel"]:
-        return list(StandardDnaModel)
+        return _STANDARD_DNA_MODELS
 
     @staticmethod
     def num_available_models() -> int:
-        return len(StandardDnaModel)
+        return len(_STANDARD_DNA_MODELS)
 
     @property
     def description(self) -> str:
-        return self._descriptions()[self]
-
-    @staticmethod
-    @functools.cache
-    def _descriptions() -> dict[SubstitutionModel, str]:
-        return {
-            StandardDnaModel.JC: "Equal substitution rates and equal base frequencies (Jukes and Cantor, 1969).",
-            StandardDnaModel.JC69: "Equal substitution rates and equal base frequencies (Jukes and Cantor, 1969).",
-            StandardDnaModel.F81: "Equal rates but unequal base freq. (Felsenstein, 1981).",
-            StandardDnaModel.K80: "Unequal transition/transversion rates and equal base freq. (Kimura, 1980).",
-            StandardDnaModel.K2P: "Unequal transition/transversion rates and equal base freq. (Kimura, 1980).",
-            StandardDnaModel.HKY: "Unequal transition/transversion rates and unequal base freq. (Hasegawa, Kishino and Yano, 1985).",
-            StandardDnaModel.HKY85: "Unequal transition/transversion rates and unequal base freq. (Hasegawa, Kishino and Yano, 1985).",
-            StandardDnaModel.TN: "Like HKY but unequal purine/pyrimidine rates (Tamura and Nei, 1993).",
-            StandardDnaModel.TN93: "Like HKY but unequal purine/pyrimidine rates (Tamura and Nei, 1993).",
-            StandardDnaModel.TNe: "Like TN but equal base freq.",
-            StandardDnaModel.K81: "Three substitution types model and equal base freq. (Kimura, 1981).",
-            StandardDnaModel.K3P: "Three substitution types model and equal base freq. (Kimura, 1981).",
-            StandardDnaModel.K81u: "Like K81 but unequal base freq.",
-            StandardDnaModel.TPM2: "AC=AT, AG=CT, CG=GT and equal base freq.",
-            StandardDnaModel.TPM2u: "Like TPM2 but unequal base freq.",
-            StandardDnaModel.TPM3: "AC=CG, AG=CT, AT=GT and equal base freq.",
-            StandardDnaModel.TPM3u: "Like TPM3 but unequal base freq.",
-            StandardDnaModel.TIM: "Transition model, AC=GT, AT=CG and unequal base freq.",
-            StandardDnaModel.TIMe: "Like TIM but equal base freq.",
-            StandardDnaModel.TIM2: "AC=AT, CG=GT and unequal base freq.",
-            StandardDnaModel.TIM2e: "Like TIM2 but equal base freq.",
-            StandardDnaModel.TIM3: "AC=CG, AT=GT and unequal base freq.",
-            StandardDnaModel.TIM3e: "Like TIM3 but equal base freq.",
-            StandardDnaModel.TVM: "Transversion model, AG=CT and unequal base freq.",
-            StandardDnaModel.TVMe: "Like TVM but equal base freq.",
-            StandardDnaModel.SYM: "Symmetric model with unequal rates but equal base freq. (Zharkikh, 1994).",
-            StandardDnaModel.GTR: "General time reversible model with unequal rates and unequal base freq. (Tavare, 1986).",
-            StandardDnaModel.STRSYM: "Strand-symmetric model (Bielawski and Gold, 2002).",
-            StandardDnaModel.UNREST: "Unrestricted model.",
-        }
+        return self._description
+
+
+_STANDARD_DNA_MODEL_DESCRIPTIONS: dict[SubstitutionModel, str] = {
+    StandardDnaModel.JC: "Equal substitution rates and equal base frequencies (Jukes and Cantor, 1969).",
+    StandardDnaModel.JC69: "Equal substitution rates and equal base frequencies (Jukes and Cantor, 1969).",
+    StandardDnaModel.F81: "Equal rates but unequal base freq. (Felsenstein, 1981).",
+    StandardDnaModel.K80: "Unequal transition/transversion rates and equal base freq. (Kimura, 1980).",
+    StandardDnaModel.K2P: "Unequal transition/transversion rates and equal base freq. (Kimura, 1980).",
+    StandardDnaModel.HKY: "Unequal transition/transversion rates and unequal base freq. (Hasegawa, Kishino and Yano, 1985).",
+    StandardDnaModel.HKY85: "Unequal transition/transversion rates and unequal base freq. (Hasegawa, Kishino and Yano, 1985).",
+    StandardDnaModel.TN: "Like HKY but unequal purine/pyrimidine rates (Tamura and Nei, 1993).",
+    StandardDnaModel.TN93: "Like HKY but unequal purine/pyrimidine rates (Tamura and Nei, 1993).",
+    StandardDnaModel.TNe: "Like TN but equal base freq.",
+    StandardDnaModel.K81: "Three substitution types model and equal base freq. (Kimura, 1981).",
+    StandardDnaModel.K3P: "Three substitution types model and equal base freq. (Kimura, 1981).",
+    StandardDnaModel.K81u: "Like K81 but unequal base freq.",
+    StandardDnaModel.TPM2: "AC=AT, AG=CT, CG=GT and equal base freq.",
+    StandardDnaModel.TPM2u: "Like TPM2 but unequal base freq.",
+    StandardDnaModel.TPM3: "AC=CG, AG=CT, AT=GT and equal base freq.",
+    StandardDnaModel.TPM3u: "Like TPM3 but unequal base freq.",
+    StandardDnaModel.TIM: "Transition model, AC=GT, AT=CG and unequal base freq.",
+    StandardDnaModel.TIMe: "Like TIM but equal base freq.",
+    StandardDnaModel.TIM2: "AC=AT, CG=GT and unequal base freq.",
+    StandardDnaModel.TIM2e: "Like TIM2 but equal base freq.",
+    StandardDnaModel.TIM3: "AC=CG, AT=GT and unequal base freq.",
+    StandardDnaModel.TIM3e: "Like TIM3 but equal base freq.",
+    StandardDnaModel.TVM: "Transversion model, AG=CT and unequal base freq.",
+    StandardDnaModel.TVMe: "Like TVM but equal base freq.",
+    StandardDnaModel.SYM: "Symmetric model with unequal rates but equal base freq. (Zharkikh, 1994).",
+    StandardDnaModel.GTR: "General time reversible model with unequal rates and unequal base freq. (Tavare, 1986).",
+    StandardDnaModel.STRSYM: "Strand-symmetric model (Bielawski and Gold, 2002).",
+    StandardDnaModel.UNREST: "Unrestricted model.",
+}
+_store_descriptions(_STANDARD_DNA_MODEL_DESCRIPTIONS)
+
+_STANDARD_DNA_MODELS: tuple[StandardDnaModel, ...] = tuple(StandardDnaModel)
 
 
 lie_model_pairing = Literal["RY", "WS", "MK"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LieModelInstance(SubstitutionModel):
     lie_model: "LieModel"
     pairing: lie_model_pairing | None = None
     model_params: Sequence[float] | None = None
+    _iqtree_str: str = field(init=False, repr=False, compare=False)
 
     valid_pairings: ClassVar[
         tuple[lie_model_pairing, lie_model_pairing, lie_model_pairing]
@@ -272,16 +301,24 @@ class LieModelInstance(SubstitutionModel):
             msg = f"Invalid Lie Model pairing prefix: '{self.pairing}'"
             raise ValueError(msg)
 
+        if self.model_params is not None:
+            # Store as a tuple so instances are always hashable
+            object.__setattr__(self, "model_params", tuple(self.model_params))
+
+        object.__setattr__(
+            self,
+            "_iqtree_str",
+            (self.pairing or "")
+            + self.lie_model.value
+            + _format_model_params(self.model_params),
+        )
+
     @staticmethod
     def model_type() -> str:
         return "nucleotide"
 
     def iqtree_str(self) -> str:
-        prefix = self.pairing or ""
-        params = (
-            f"{{{','.join(map(str, self.model_params))}}}" if self.model_params else ""
-        )
-        return f"{prefix}{self.lie_model.value}{params}"
+        return self._iqtree_str
 
     def get_moltype(self) -> Literal["dna", "protein"]:
         return "dna"
@@ -292,22 +329,15 @@ class LieModelInstance(SubstitutionModel):
 
     @staticmethod
     def iter_available_models() -> Sequence["LieModelInstance"]:
-        return [
-            LieModelInstance(lie_model, prefix)
-            for prefix in (None, *LieModelInstance.valid_pairings)
-            for lie_model in LieModel
-        ]
+        return _LIE_MODEL_INSTANCES
 
     @staticmethod
     def num_available_models() -> int:
-        return (len(LieModelInstance.valid_pairings) + 1) * len(LieModel)
+        return len(_LIE_MODEL_INSTANCES)
 
     @property
     def description(self) -> str:
-        base_desc = LieModel._descriptions()[self.lie_model]  # noqa: SLF001
-        if self.pairing is None:
-            return base_desc
-        return f"{base_desc} Pairing: {LieModelInstance.pairing_descriptions[self.pairing]}"
+        return _LIE_INSTANCE_DESCRIPTIONS[self.lie_model, self.pairing]
 
 
 class LieModel(SubstitutionModel, Enum):
@@ -349,6 +379,8 @@ class LieModel(SubstitutionModel, Enum):
     LIE_10_34 = "10.34"
     LIE_12_12 = "12.12"
 
+    _description: str
+
     def __call__(
         self,
         pairing: lie_model_pairing | None = None,
@@ -383,7 +415,7 @@ class LieModel(SubstitutionModel, Enum):
         return "nucleotide"
 
     def iqtree_str(self) -> str:
-        return self.value
+        return self._value_
 
     def get_moltype(self) -> Literal["dna", "protein"]:
         return "dna"
@@ -394,58 +426,73 @@ class LieModel(SubstitutionModel, Enum):
 
     @staticmethod
     def iter_available_models() -> Sequence[LieModelInstance]:
-        return LieModelInstance.iter_available_models()
+        return _LIE_MODEL_INSTANCES
 
     @staticmethod
     def num_available_models() -> int:
-        return LieModelInstance.num_available_models()
+        return len(_LIE_MODEL_INSTANCES)
 
     @property
     def description(self) -> str:
-        return LieModel._descriptions()[self]
-
-    @staticmethod
-    @functools.cache
-    def _descriptions() -> dict[SubstitutionModel, str]:
-        return {
-            LieModel.LIE_1_1: "Reversible model. Equal base frequencies. equiv. to JC",
-            LieModel.LIE_2_2b: "Reversible model. Equal base frequencies. equiv. to K2P",
-            LieModel.LIE_3_3a: "Reversible model. Equal base frequencies. equiv. to K3P",
-            LieModel.LIE_3_3b: "Non-reversible model. Equal base frequencies.",
-            LieModel.LIE_3_3c: "Reversible model. Equal base frequencies. equiv. to TNe",
-            LieModel.LIE_3_4: "Reversible model. f(A)=f(G) and f(C)=f(T).",
-            LieModel.LIE_4_4a: "Reversible model. Unconstrained base frequencies. equiv. to F81",
-            LieModel.LIE_4_4b: "Reversible model. f(A)=f(G) and f(C)=f(T).",
-            LieModel.LIE_4_5a: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
-            LieModel.LIE_4_5b: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
-            LieModel.LIE_5_6a: "Non-reversible model. Equal base frequencies.",
-            LieModel.LIE_5_6b: "Non-reversible model. Unconstrained base frequencies.",
-            LieModel.LIE_5_7a: "Non-reversible model. f(A)+f(G)=0.5=f(C)+f(T).",
-            LieModel.LIE_5_7b: "Non-reversible model. Equal base frequencies.",
-            LieModel.LIE_5_7c: "Non-reversible model. Equal base frequencies.",
-            LieModel.LIE_5_11a: "Non-reversible model. f(A)+f(G)=0.5=f(C)+f(T).",
-            LieModel.LIE_5_11b: "Non-reversible model. Equal base frequencies.",
-            LieModel.LIE_5_11c: "Non-reversible model. Equal base frequencies.",
-            LieModel.LIE_5_16: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
-            LieModel.LIE_6_6: "Non-reversible model. f(A)=f(G) and f(C)=f(T). equiv. to STRSYM for strand-symmetric model (Bielawski and Gold, 2002)",
-            LieModel.LIE_6_7a: "Non-reversible model. Unconstrained base frequencies. F81+K3P",
-            LieModel.LIE_6_7b: "Non-reversible model. Unconstrained base frequencies.",
-            LieModel.LIE_6_8a: "Non-reversible model. Unconstrained base frequencies.",
-            LieModel.LIE_6_8b: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
-            LieModel.LIE_6_17a: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
-            LieModel.LIE_6_17b: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
-            LieModel.LIE_8_8: "Non-reversible model. Unconstrained base frequencies.",
-            LieModel.LIE_8_10a: "Non-reversible model. Unconstrained base frequencies.",
-            LieModel.LIE_8_10b: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
-            LieModel.LIE_8_16: "Non-reversible model. Unconstrained base frequencies.",
-            LieModel.LIE_8_17: "Non-reversible model. Unconstrained base frequencies.",
-            LieModel.LIE_8_18: "Non-reversible model. Unconstrained base frequencies.",
-            LieModel.LIE_9_20a: "Non-reversible model. f(A)+f(G)=0.5=f(C)+f(T).",
-            LieModel.LIE_9_20b: "Non-reversible model. Equal base frequencies. Doubly stochastic",
-            LieModel.LIE_10_12: "Non-reversible model. Unconstrained base frequencies.",
-            LieModel.LIE_10_34: "Non-reversible model. Unconstrained base frequencies.",
-            LieModel.LIE_12_12: "Non-reversible model. Unconstrained base frequencies. equiv. to UNREST (unrestricted model)",
-        }
+        return self._description
+
+
+_LIE_MODEL_DESCRIPTIONS: dict[SubstitutionModel, str] = {
+    LieModel.LIE_1_1: "Reversible model. Equal base frequencies. equiv. to JC",
+    LieModel.LIE_2_2b: "Reversible model. Equal base frequencies. equiv. to K2P",
+    LieModel.LIE_3_3a: "Reversible model. Equal base frequencies. equiv. to K3P",
+    LieModel.LIE_3_3b: "Non-reversible model. Equal base frequencies.",
+    LieModel.LIE_3_3c: "Reversible model. Equal base frequencies. equiv. to TNe",
+    LieModel.LIE_3_4: "Reversible model. f(A)=f(G) and f(C)=f(T).",
+    LieModel.LIE_4_4a: "Reversible model. Unconstrained base frequencies. equiv. to F81",
+    LieModel.LIE_4_4b: "Reversible model. f(A)=f(G) and f(C)=f(T).",
+    LieModel.LIE_4_5a: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
+    LieModel.LIE_4_5b: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
+    LieModel.LIE_5_6a: "Non-reversible model. Equal base frequencies.",
+    LieModel.LIE_5_6b: "Non-reversible model. Unconstrained base frequencies.",
+    LieModel.LIE_5_7a: "Non-reversible model. f(A)+f(G)=0.5=f(C)+f(T).",
+    LieModel.LIE_5_7b: "Non-reversible model. Equal base frequencies.",
+    LieModel.LIE_5_7c: "Non-reversible model. Equal base frequencies.",
+    LieModel.LIE_5_11a: "Non-reversible model. f(A)+f(G)=0.5=f(C)+f(T).",
+    LieModel.LIE_5_11b: "Non-reversible model. Equal base frequencies.",
+    LieModel.LIE_5_11c: "Non-reversible model. Equal base frequencies.",
+    LieModel.LIE_5_16: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
+    LieModel.LIE_6_6: "Non-reversible model. f(A)=f(G) and f(C)=f(T). equiv. to STRSYM for strand-symmetric model (Bielawski and Gold, 2002)",
+    LieModel.LIE_6_7a: "Non-reversible model. Unconstrained base frequencies. F81+K3P",
+    LieModel.LIE_6_7b: "Non-reversible model. Unconstrained base frequencies.",
+    LieModel.LIE_6_8a: "Non-reversible model. Unconstrained base frequencies.",
+    LieModel.LIE_6_8b: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
+    LieModel.LIE_6_17a: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
+    LieModel.LIE_6_17b: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
+    LieModel.LIE_8_8: "Non-reversible model. Unconstrained base frequencies.",
+    LieModel.LIE_8_10a: "Non-reversible model. Unconstrained base frequencies.",
+    LieModel.LIE_8_10b: "Non-reversible model. f(A)=f(G) and f(C)=f(T).",
+    LieModel.LIE_8_16: "Non-reversible model. Unconstrained base frequencies.",
+    LieModel.LIE_8_17: "Non-reversible model. Unconstrained base frequencies.",
+    LieModel.LIE_8_18: "Non-reversible model. Unconstrained base frequencies.",
+    LieModel.LIE_9_20a: "Non-reversible model. f(A)+f(G)=0.5=f(C)+f(T).",
+    LieModel.LIE_9_20b: "Non-reversible model. Equal base frequencies. Doubly stochastic",
+    LieModel.LIE_10_12: "Non-reversible model. Unconstrained base frequencies.",
+    LieModel.LIE_10_34: "Non-reversible model. Unconstrained base frequencies.",
+    LieModel.LIE_12_12: "Non-reversible model. Unconstrained base frequencies. equiv. to UNREST (unrestricted model)",
+}
+_store_descriptions(_LIE_MODEL_DESCRIPTIONS)
+
+_LIE_INSTANCE_DESCRIPTIONS: dict[tuple[LieModel, lie_model_pairing | None], str] = {
+    (lie_model, pairing): (
+        lie_model.description
+        if pairing is None
+        else f"{lie_model.description} Pairing: {LieModelInstance.pairing_descriptions[pairing]}"
+    )
+    for pairing in (None, *LieModelInstance.valid_pairings)
+    for lie_model in LieModel
+}
+
+_LIE_MODEL_INSTANCES: tuple[LieModelInstance, ...] = tuple(
+    LieModelInstance(lie_model, prefix)
+    for prefix in (None, *LieModelInstance.valid_pairings)
+    for lie_model in LieModel
+)
 
 
 @unique
@@ -491,12 +538,14 @@ class AaModel(SubstitutionModel, Enum):
     VT = "VT"
     WAG = "WAG"
 
+    _description: str
+
     @staticmethod
     def model_type() -> str:
         return "protein"
 
     def iqtree_str(self) -> str:
-        return self.value
+        return self._value_
 
     def get_moltype(self) -> Literal["dna", "protein"]:
         return "protein"
@@ -507,59 +556,60 @@ class AaModel(SubstitutionModel, Enum):
 
     @staticmethod
     def iter_available_models() -> Sequence["AaModel"]:
-        return list(AaModel)
+        return _AA_MODELS
 
     @staticmethod
     def num_available_models() -> int:
-        return len(AaModel)
+        return len(_AA_MODELS)
 
     @property
     def description(self) -> str:
-        return self._descriptions()[self]
-
-    @staticmethod
-    @functools.cache
-    def _descriptions() -> dict[SubstitutionModel, str]:
-        return {
-            AaModel.Blosum62: "BLOcks SUbstitution Matrix (Henikoff and Henikoff, 1992). Note that BLOSUM62 is not recommended for phylogenetic analysis as it was designed mainly for sequence alignments.",
-            AaModel.cpREV: "chloroplast matrix (Adachi et al., 2000).",
-            AaModel.Dayhoff: "General matrix (Dayhoff et al., 1978).",
-            AaModel.DCMut: "Revised Dayhoff matrix (Kosiol and Goldman, 2005).",
-            AaModel.EAL: "General matrix. To be used with profile mixture models (for eg. EAL+C60) for reconstructing relationships between eukaryotes and Archaea (Banos et al., 2024).",
-            AaModel.ELM: "General matrix. To be used with profile mixture models (for eg. ELM+C60) for phylogenetic analysis of proteins encoded by nuclear genomes of eukaryotes (Banos et al., 2024).",
-            AaModel.FLAVI: "Flavivirus (Le and Vinh, 2020).",
-            AaModel.FLU: "Influenza virus (Dang et al., 2010).",
-            AaModel.GTR20: "General time reversible models with 190 rate parameters.",
-            AaModel.HIVb: "HIV between-patient matrix HIV-Bm (Nickle et al., 2007).",
-            AaModel.HIVw: "HIV within-patient matrix HIV-Wm (Nickle et al., 2007).",
-            AaModel.JTT: "General matrix (Jones et al., 1992).",
-            AaModel.JTTDCMut: "Revised JTT matrix (Kosiol and Goldman, 2005).",
-            AaModel.LG: "General matrix (Le and Gascuel, 2008).",
-            AaModel.mtART: "Mitochondrial Arthropoda (Abascal et al., 2007).",
-            AaModel.mtMAM: "Mitochondrial Mammalia (Yang et al., 1998).",
-            AaModel.mtREV: "Mitochondrial Vertebrate (Adachi and Hasegawa, 1996).",
-            AaModel.mtZOA: "Mitochondrial Metazoa (Animals) (Rota-Stabelli et al., 2009).",
-            AaModel.mtMet: "Mitochondrial Metazoa (Vinh et al., 2017).",
-            AaModel.mtVer: "Mitochondrial Vertebrate (Vinh et al., 2017).",
-            AaModel.mtInv: "Mitochondrial Invertebrate (Vinh et al., 2017).",
-            AaModel.NQ_bird: "Non-reversible Q matrix (Dang et al., 2022) estimated for birds (Jarvis et al., 2015).",
-            AaModel.NQ_insect: "Non-reversible Q matrix (Dang et al., 2022) estimated for insects (Misof et al., 2014).",
-            AaModel.NQ_mammal: "Non-reversible Q matrix (Dang et al., 2022) estimated for mammals (Wu et al., 2018).",
-            AaModel.NQ_pfam: "General non-reversible Q matrix (Dang et al., 2022) estimated from Pfam version 31 database (El-Gebali et al., 2018).",
-            AaModel.NQ_plant: "Non-reversible Q matrix (Dang et al., 2022) estimated for plants (Ran et al., 2018).",
-            AaModel.NQ_yeast: "Non-reversible Q matrix (Dang et al., 2022) estimated for yeasts (Shen et al., 2018).",
-            AaModel.Poisson: "Equal amino-acid exchange rates and frequencies.",
-            AaModel.PMB: "Probability Matrix from Blocks, revised BLOSUM matrix (Veerassamy et al., 2004).",
-            AaModel.Q_bird: "Q matrix (Minh et al., 2021) estimated for birds (Jarvis et al., 2015).",
-            AaModel.Q_insect: "Q matrix (Minh et al., 2021) estimated for insects (Misof et al., 2014).",
-            AaModel.Q_mammal: "Q matrix (Minh et al., 2021) estimated for mammals (Wu et al., 2018).",
-            AaModel.Q_pfam: "General Q matrix (Minh et al., 2021) estimated from Pfam version 31 database (El-Gebali et al., 2018).",
-            AaModel.Q_plant: "Q matrix (Minh et al., 2021) estimated for plants (Ran et al., 2018).",
-            AaModel.Q_yeast: "Q matrix (Minh et al., 2021) estimated for yeasts (Shen et al., 2018).",
-            AaModel.rtREV: "Retrovirus (Dimmic et al., 2002).",
-            AaModel.VT: "General 'Variable Time' matrix (Mueller and Vingron, 2000).",
-            AaModel.WAG: "General matrix (Whelan and Goldman, 2001).",
-        }
+        return self._description
+
+
+_AA_MODEL_DESCRIPTIONS: dict[SubstitutionModel, str] = {
+    AaModel.Blosum62: "BLOcks SUbstitution Matrix (Henikoff and Henikoff, 1992). Note that BLOSUM62 is not recommended for phylogenetic analysis as it was designed mainly for sequence alignments.",
+    AaModel.cpREV: "chloroplast matrix (Adachi et al., 2000).",
+    AaModel.Dayhoff: "General matrix (Dayhoff et al., 1978).",
+    AaModel.DCMut: "Revised Dayhoff matrix (Kosiol and Goldman, 2005).",
+    AaModel.EAL: "General matrix. To be used with profile mixture models (for eg. EAL+C60) for reconstructing relationships between eukaryotes and Archaea (Banos et al., 2024).",
+    AaModel.ELM: "General matrix. To be used with profile mixture models (for eg. ELM+C60) for phylogenetic analysis of proteins encoded by nuclear genomes of eukaryotes (Banos et al., 2024).",
+    AaModel.FLAVI: "Flavivirus (Le and Vinh, 2020).",
+    AaModel.FLU: "Influenza virus (Dang et al., 2010).",
+    AaModel.GTR20: "General time reversible models with 190 rate parameters.",
+    AaModel.HIVb: "HIV between-patient matrix HIV-Bm (Nickle et al., 2007).",
+    AaModel.HIVw: "HIV within-patient matrix HIV-Wm (Nickle et al., 2007).",
+    AaModel.JTT: "General matrix (Jones et al., 1992).",
+    AaModel.JTTDCMut: "Revised JTT matrix (Kosiol and Goldman, 2005).",
+    AaModel.LG: "General matrix (Le and Gascuel, 2008).",
+    AaModel.mtART: "Mitochondrial Arthropoda (Abascal et al., 2007).",
+    AaModel.mtMAM: "Mitochondrial Mammalia (Yang et al., 1998).",
+    AaModel.mtREV: "Mitochondrial Vertebrate (Adachi and Hasegawa, 1996).",
+    AaModel.mtZOA: "Mitochondrial Metazoa (Animals) (Rota-Stabelli et al., 2009).",
+    AaModel.mtMet: "Mitochondrial Metazoa (Vinh et al., 2017).",
+    AaModel.mtVer: "Mitochondrial Vertebrate (Vinh et al., 2017).",
+    AaModel.mtInv: "Mitochondrial Invertebrate (Vinh et al., 2017).",
+    AaModel.NQ_bird: "Non-reversible Q matrix (Dang et al., 2022) estimated for birds (Jarvis et al., 2015).",
+    AaModel.NQ_insect: "Non-reversible Q matrix (Dang et al., 2022) estimated for insects (Misof et al., 2014).",
+    AaModel.NQ_mammal: "Non-reversible Q matrix (Dang et al., 2022) estimated for mammals (Wu et al., 2018).",
+    AaModel.NQ_pfam: "General non-reversible Q matrix (Dang et al., 2022) estimated from Pfam version 31 database (El-Gebali et al., 2018).",
+    AaModel.NQ_plant: "Non-reversible Q matrix (Dang et al., 2022) estimated for plants (Ran et al., 2018).",
+    AaModel.NQ_yeast: "Non-reversible Q matrix (Dang et al., 2022) estimated for yeasts (Shen et al., 2018).",
+    AaModel.Poisson: "Equal amino-acid exchange rates and frequencies.",
+    AaModel.PMB: "Probability Matrix from Blocks, revised BLOSUM matrix (Veerassamy et al., 2004).",
+    AaModel.Q_bird: "Q matrix (Minh et al., 2021) estimated for birds (Jarvis et al., 2015).",
+    AaModel.Q_insect: "Q matrix (Minh et al., 2021) estimated for insects (Misof et al., 2014).",
+    AaModel.Q_mammal: "Q matrix (Minh et al., 2021) estimated for mammals (Wu et al., 2018).",
+    AaModel.Q_pfam: "General Q matrix (Minh et al., 2021) estimated from Pfam version 31 database (El-Gebali et al., 2018).",
+    AaModel.Q_plant: "Q matrix (Minh et al., 2021) estimated for plants (Ran et al., 2018).",
+    AaModel.Q_yeast: "Q matrix (Minh et al., 2021) estimated for yeasts (Shen et al., 2018).",
+    AaModel.rtREV: "Retrovirus (Dimmic et al., 2002).",
+    AaModel.VT: "General 'Variable Time' matrix (Mueller and Vingron, 2000).",
+    AaModel.WAG: "General matrix (Whelan and Goldman, 2001).",
+}
+_store_descriptions(_AA_MODEL_DESCRIPTIONS)
+
+_AA_MODELS: tuple[AaModel, ...] = tuple(AaModel)
 
 
 ALL_MODELS_CLASSES: tuple[type[SubstitutionModel], ...] = (
@@ -568,6 +618,28 @@ ALL_MODELS_CLASSES: tuple[type[SubstitutionModel], ...] = (
     AaModel,
 )
 
+ALL_MODELS: tuple[SubstitutionModel, ...] = tuple(
+    itertools.chain.from_iterable(
+        model_class.iter_available_models() for model_class in ALL_MODELS_CLASSES
+    ),
+)
+
+
+# Every accepted (normalised) model name mapped to its enum member.
+# Lie models are keyed without their "LIE_" prefix. Member names are already
+# interned as identifiers, the stripped Lie names are interned to match.
+_MODEL_LOOKUP: dict[str, SubstitutionModel] = {
+    **AaModel.__members__,
+    **StandardDnaModel.__members__,
+    **{
+        sys.intern(name.removeprefix("LIE_")): model
+        for name, model in LieModel.__members__.items()
+    },
+}
+
+# A model name optionally followed by a {...} parameterisation.
+_MODEL_NAME_PATTERN = re.compile(r"(?P<name>[^{}]*)(?:\{(?P<params>[^{}]*)\})?")
+
 
 def get_substitution_model(name: str | SubstitutionModel) -> SubstitutionModel:
     """Return the substitution model enum for a given name.
@@ -586,59 +658,65 @@ def get_substitution_model(name: str | SubstitutionModel) -> SubstitutionModel:
     if isinstance(name, SubstitutionModel):
         return name
 
-    norm_name = _normalise_prefix(name)
+    return _parse_substitution_model(name)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_substitution_model(name: str) -> SubstitutionModel:
+    # Parsed models are immutable, so repeated names can share the result
+    match = _MODEL_NAME_PATTERN.fullmatch(name)
+    if match is None:
+        if "{" in name and not name.endswith("}"):
+            msg = f"Missing closing bracket for parameterisation of {name!r}"
+            raise ValueError(msg)
+        base_name, bracket, _ = name.partition("{")
+        if bracket and _is_model_name(base_name):
+            msg = f"Invalid parameterisation of {name!r}"
+            raise ValueError(msg)
+        msg = f"Unknown substitution model: {name!r}"
+        raise ValueError(msg)
+
+    norm_name = match["name"].replace(".", "_")
 
     if len(norm_name) == 0:
         msg = f"Unknown substitution model: {name!r}"
         raise ValueError(msg)
 
-    # No parameterisation of AaModels
-    with contextlib.suppress(KeyError):
-        return AaModel[norm_name]
+    params = match["params"]
+    model_params = None if params is None else tuple(map(float, params.split(",")))
 
-    model_params = _get_model_parameters(norm_name)
+    model = _MODEL_LOOKUP.get(norm_name)
 
-    if model_params is not None:
-        norm_name = norm_name[: norm_name.find("{")]
+    # No parameterisation of AaModels
+    if isinstance(model, AaModel) and model_params is None:
+        return model
 
-    with contextlib.suppress(KeyError):
-        return StandardDnaModel[norm_name](model_params)
+    if isinstance(model, StandardDnaModel):
+        return model(model_params)
 
     # Lie models
     prefix = _get_lie_prefix(norm_name)
     if prefix is not None:
         norm_name = norm_name[2:]
 
-    with contextlib.suppress(KeyError):
-        return LieModel["LIE_" + norm_name](prefix, model_params)
+    model = _MODEL_LOOKUP.get(norm_name)
+    if isinstance(model, LieModel):
+        return model(prefix, model_params)
 
     msg = f"Unknown substitution model: {name!r}"
     raise ValueError(msg)
 
 
-def _normalise_prefix(name: str) -> str:
-    parts = name.split("{")
-    parts[0] = parts[0].replace(".", "_")
-    return "{".join(parts)
+def _is_model_name(name: str) -> bool:
+    norm_name = name.replace(".", "_")
+    if norm_name in _MODEL_LOOKUP:
+        return True
+    if _get_lie_prefix(norm_name) is not None:
+        return isinstance(_MODEL_LOOKUP.get(norm_name[2:]), LieModel)
+    return False
 
 
 def _get_lie_prefix(name: str) -> lie_model_pairing | None:
-    potential_prefix = name[:2]
-    if potential_prefix in LieModelInstance.valid_pairings:
-        return cast("lie_model_pairing", potential_prefix)
+    if name.startswith(LieModelInstance.valid_pairings):
+        return cast("lie_model_pairing", name[:2])
     return None
-
-
-def _get_model_parameters(name: str) -> tuple[float, ...] | None:
-    params_start = name.find("{")
-    if params_start == -1:  # No params
-        return None
-
-    # The model is parameterised here
-    if name[-1] != "}":
-        msg = f"Missing closing bracket for parameterisation of {name!r}"
-        raise ValueError(msg)
-
-    return tuple(
-        float(param.strip()) for param in name[params_start + 1 : -1].split(",")
-    )
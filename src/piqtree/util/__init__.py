@@ -1,4 +1,4 @@
-import secrets
+import os
 from collections.abc import Iterable
 
 from cogent3.core.tree import PhyloNode
@@ -24,8 +24,7 @@ def make_rand_seed() -> int:
     int
         A 32-bit random seed.
     """
-    seed = secrets.randbits(32)
-    return seed if seed < (1 << 31) else seed - (1 << 32)
+    return int.from_bytes(os.urandom(4), "little", signed=True)
 
 
 def make_nonzero_rand_seed() -> int:
@@ -36,9 +35,8 @@ def make_nonzero_rand_seed() -> int:
     int
         A non-zero 32-bit random seed.
     """
-    while (seed := make_rand_seed()) == 0:
-        pass  # pragma: no cover
-    return seed
+    # Remap zero rather than redrawing, so only a single draw is ever needed
+    return make_rand_seed() or 1
 
 
 def process_rand_seed_nonzero(seed: int | None) -> int:
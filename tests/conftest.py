@@ -1,8 +1,36 @@
+import contextlib
+import os
 import pathlib
+from collections.abc import Iterator
 
 import pytest
 from cogent3 import PhyloNode, load_aligned_seqs, make_tree
 from cogent3.core.alignment import Alignment
+from cogent3.evolve.fast_distance import DistanceMatrix
+
+import piqtree
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: list[pytest.Item],
+) -> None:
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="needs --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
 
 @pytest.fixture(scope="session")
@@ -10,52 +38,73 @@ def DATA_DIR() -> pathlib.Path:
     return pathlib.Path(__file__).parent / "data"
 
 
-@pytest.fixture
-def three_otu(DATA_DIR: pathlib.Path) -> Alignment:
-    aln = load_aligned_seqs(DATA_DIR / "example.fasta", moltype="dna")
-    aln = aln.take_seqs(["Human", "Rhesus", "Mouse"])
-    return aln.omit_gap_pos(allowed_gap_frac=0)
+@pytest.fixture(scope="session", autouse=True)
+def iqtree_workdir(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[pathlib.Path]:
+    # Each pytest-xdist worker runs IQ-TREE from its own directory. The worker
+    # is read from the environment so the suite still runs without pytest-xdist.
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    workdir = tmp_path_factory.mktemp(f"iqtree_{worker_id}")
+    with contextlib.chdir(workdir):
+        yield workdir
 
 
-@pytest.fixture
-def four_otu(DATA_DIR: pathlib.Path) -> Alignment:
-    aln = load_aligned_seqs(
-        DATA_DIR / "example.fasta",
-        moltype="dna",
-    )
-    aln = aln.take_seqs(["Human", "Chimpanzee", "HumpbackW", "SpermWhale"])
-    aln = aln.omit_gap_pos(allowed_gap_frac=0)
-    return aln[::15]
+@pytest.fixture(scope="session")
+def dna_aln(DATA_DIR: pathlib.Path) -> Alignment:
+    return load_aligned_seqs(DATA_DIR / "example.fasta", moltype="dna")
 
 
-@pytest.fixture
-def five_otu(DATA_DIR: pathlib.Path) -> Alignment:
-    aln = load_aligned_seqs(
-        DATA_DIR / "example.fasta",
-        moltype="dna",
-    )
-    aln = aln.take_seqs(["Human", "Chimpanzee", "Rhesus", "Manatee", "Dugong"])
+@pytest.fixture(scope="session")
+def protein_aln(DATA_DIR: pathlib.Path) -> Alignment:
+    return load_aligned_seqs(DATA_DIR / "protein.fasta", moltype="protein")
+
+
+@pytest.fixture(scope="session")
+def three_otu(dna_aln: Alignment) -> Alignment:
+    aln = dna_aln.take_seqs(["Human", "Rhesus", "Mouse"])
     return aln.omit_gap_pos(allowed_gap_frac=0)
 
 
-@pytest.fixture
-def all_otu(DATA_DIR: pathlib.Path) -> Alignment:
-    aln = load_aligned_seqs(
-        DATA_DIR / "example.fasta",
-        moltype="dna",
-    )
+@pytest.fixture(scope="session")
+def three_otu_topology(three_otu: Alignment) -> PhyloNode:
+    return make_tree(tip_names=three_otu.names)
+
+
+@pytest.fixture(scope="session")
+def four_otu(dna_aln: Alignment) -> Alignment:
+    aln = dna_aln.take_seqs(["Human", "Chimpanzee", "HumpbackW", "SpermWhale"])
+    return aln.omit_gap_pos(allowed_gap_frac=0)[::15]
+
+
+@pytest.fixture(scope="session")
+def four_otu_expected_topology() -> PhyloNode:
+    return make_tree("(Human,Chimpanzee,(SpermWhale,HumpbackW));")
+
+
+@pytest.fixture(scope="session")
+def five_otu(dna_aln: Alignment) -> Alignment:
+    aln = dna_aln.take_seqs(["Human", "Chimpanzee", "Rhesus", "Manatee", "Dugong"])
     return aln.omit_gap_pos(allowed_gap_frac=0)
 
 
-@pytest.fixture
-def protein_four_otu(DATA_DIR: pathlib.Path) -> Alignment:
-    aln = load_aligned_seqs(DATA_DIR / "protein.fasta", moltype="protein")
-    aln = aln.take_seqs(sorted(aln.names)[:4])
-    aln = aln.omit_gap_pos(allowed_gap_frac=0)
-    return aln[::15]
+@pytest.fixture(scope="session")
+def five_otu_jc(five_otu: Alignment) -> DistanceMatrix:
+    return piqtree.jc_distances(five_otu)
+
+
+@pytest.fixture(scope="session")
+def all_otu(dna_aln: Alignment) -> Alignment:
+    return dna_aln.omit_gap_pos(allowed_gap_frac=0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def protein_four_otu(protein_aln: Alignment) -> Alignment:
+    aln = protein_aln.take_seqs(sorted(protein_aln.names)[:4])
+    return aln.omit_gap_pos(allowed_gap_frac=0)[::15]
+
+
+@pytest.fixture(scope="session")
 def five_trees() -> list[PhyloNode]:
     tree1 = make_tree("(a,(b,(c,(d,(e,f)))))")
     tree2 = make_tree("(a,(b,(c,(d,(e,f)))))")
@@ -66,11 +115,11 @@ def five_trees() -> list[PhyloNode]:
     return [tree1, tree2, tree3, tree4, tree5]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def four_taxon_unrooted_tree() -> PhyloNode:  # Unrooted
     return make_tree("((a:0.1,b:0.2):0.05,c:0.3,d:0.1);")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def five_taxon_rooted_tree() -> PhyloNode:  # Rooted
     return make_tree("(((a:0.1,b:0.2):0.05,(c:0.3,d:0.1):0.2):0.05,e:0.4);")
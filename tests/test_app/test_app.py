@@ -1,32 +1,44 @@
+import functools
+
+import numpy as np
 import pytest
 from cogent3 import PhyloNode, get_app, make_tree
 from cogent3.core.alignment import Alignment
+from cogent3.evolve.fast_distance import DistanceMatrix
 
 import piqtree
-from piqtree import ModelFinderResult, jc_distances, make_model
-
-
-def test_piq_build_tree(four_otu: Alignment) -> None:
-    expected = make_tree("(Human,Chimpanzee,(SpermWhale,HumpbackW));")
-    app = get_app("piq_build_tree", model="JC")
-    got = app(four_otu)
-    assert expected.same_topology(got)
+from piqtree import ModelFinderResult, make_model
+
+# apps without per-test arguments are built once for the module
+_PIQ_BUILD = get_app("piq_build_tree", model="JC")
+_PIQ_JC = get_app("piq_jc_distances")
+_PIQ_NJ = get_app("piq_nj_tree")
+_PIQ_MF = get_app("piq_model_finder")
+_PIQ_CONSENSUS = get_app("piq_consensus_tree")
+
+
+def test_piq_build_tree(
+    four_otu: Alignment,
+    four_otu_expected_topology: PhyloNode,
+) -> None:
+    got = _PIQ_BUILD(four_otu)
+    assert four_otu_expected_topology.same_topology(got)
     assert got.source == four_otu.source
 
 
+@pytest.mark.slow
 def test_piq_build_tree_support(four_otu: Alignment) -> None:
     app = get_app("piq_build_tree", model=make_model("JC"), bootstrap_reps=1000)
     got = app(four_otu)
-    supports = [
+    assert all(
         node.support
         for node in got.postorder()
         if not node.is_tip() and node.name != "root"
-    ]
-    assert all(supports)
+    )
 
 
-def test_piq_fit_tree(three_otu: Alignment) -> None:
-    tree = make_tree(tip_names=three_otu.names)
+def test_piq_fit_tree(three_otu: Alignment, three_otu_topology: PhyloNode) -> None:
+    tree = three_otu_topology
     app = get_app("model", "JC69", tree=tree)
     expected = app(three_otu)
     piphylo = get_app("piq_fit_tree", tree=tree, model="JC")
@@ -35,7 +47,7 @@ def test_piq_fit_tree(three_otu: Alignment) -> None:
     assert got.source == three_otu.source
 
 
-@pytest.mark.parametrize("num_taxa", [10, 50, 100])
+@pytest.mark.parametrize("num_taxa", [10, pytest.param(100, marks=pytest.mark.slow)])
 @pytest.mark.parametrize("tree_mode", list(piqtree.TreeGenMode))
 def test_piq_random_tree(num_taxa: int, tree_mode: piqtree.TreeGenMode) -> None:
     app = get_app("piq_random_tree", tree_mode=tree_mode, rand_seed=1)
@@ -44,79 +56,67 @@ def test_piq_random_tree(num_taxa: int, tree_mode: piqtree.TreeGenMode) -> None:
     assert len(tree.tips()) == num_taxa
 
 
-def test_piq_jc_distances(five_otu: Alignment) -> None:
-    app = get_app("piq_jc_distances")
-    dists = app(five_otu)
-
-    assert (
-        0 < dists["Human", "Chimpanzee"] < dists["Human", "Dugong"]
-    )  # chimpanzee closer than rhesus
-    assert (
-        0 < dists["Human", "Rhesus"] < dists["Human", "Manatee"]
-    )  # rhesus closer than manatee
-    assert (
-        0 < dists["Human", "Rhesus"] < dists["Human", "Dugong"]
-    )  # rhesus closer than dugong
-
-    assert (
-        0 < dists["Chimpanzee", "Rhesus"] < dists["Chimpanzee", "Manatee"]
-    )  # rhesus closer than manatee
-    assert (
-        0 < dists["Chimpanzee", "Rhesus"] < dists["Chimpanzee", "Dugong"]
-    )  # rhesus closer than dugong
-
-    assert (
-        0 < dists["Manatee", "Dugong"] < dists["Manatee", "Rhesus"]
-    )  # dugong closer than rhesus
+def test_piq_jc_distances(
+    five_otu: Alignment,
+    five_otu_jc: DistanceMatrix,
+) -> None:
+    dists = _PIQ_JC(five_otu)
 
+    # the values themselves are checked in test_distance
+    np.testing.assert_allclose(dists.array, five_otu_jc.array)
     assert dists.source == five_otu.source
 
 
-def test_piq_nj_tree(five_otu: Alignment) -> None:
-    dists = jc_distances(five_otu)
-
+def test_piq_nj_tree(five_otu_jc: DistanceMatrix) -> None:
     expected = make_tree("(((Human, Chimpanzee), Rhesus), Manatee, Dugong);")
 
-    app = get_app("piq_nj_tree")
-
-    actual = app(dists)
+    actual = _PIQ_NJ(five_otu_jc)
 
     assert expected.same_topology(actual)
 
 
-def test_piq_model_finder(five_otu: Alignment) -> None:
-    app = get_app("piq_model_finder")
-    got = app(five_otu)
-    assert isinstance(got, ModelFinderResult)
+@pytest.fixture(scope="module")
+def five_otu_model_finder(five_otu: Alignment) -> ModelFinderResult:
+    return _PIQ_MF(five_otu)
+
 
+def test_piq_model_finder(five_otu_model_finder: ModelFinderResult) -> None:
+    assert isinstance(five_otu_model_finder, ModelFinderResult)
 
-def test_piq_model_finder_result_roundtrip(five_otu: Alignment) -> None:
-    app = get_app("piq_model_finder")
-    got = app(five_otu)
+
+def test_piq_model_finder_result_roundtrip(
+    five_otu_model_finder: ModelFinderResult,
+) -> None:
+    got = five_otu_model_finder
     rd = got.to_rich_dict()
     inflated = ModelFinderResult.from_rich_dict(rd)
     assert isinstance(inflated, ModelFinderResult)
     assert str(got.best_aicc) == str(inflated.best_aicc)
 
 
-def tree_equal(tree1: PhyloNode, tree2: PhyloNode) -> bool:
-    return str(tree1.sorted()) == str(tree2.sorted())
+@functools.cache
+def canonical(newick: str) -> str:
+    return str(make_tree(newick).sorted())
+
+
+def tree_equal(tree: PhyloNode, expected: str) -> bool:
+    return str(tree.sorted()) == canonical(expected)
 
 
 def test_piq_consesus_tree(five_trees: list[PhyloNode]) -> None:
-    app_majority = get_app("piq_consensus_tree")
+    app_majority = _PIQ_CONSENSUS
     app_strict = get_app("piq_consensus_tree", min_support=1)
     app_0_3 = get_app("piq_consensus_tree", min_support=0.3)
 
-    expected_majority = make_tree("((a,b),(((e,f),d),c))")
+    expected_majority = "((a,b),(((e,f),d),c))"
     got_majority = app_majority(five_trees)
     assert tree_equal(got_majority, expected_majority)
 
-    expected_strict = make_tree("(a,b,c,d,(e,f));")
+    expected_strict = "(a,b,c,d,(e,f));"
     got_strict = app_strict(five_trees)
     assert tree_equal(got_strict, expected_strict)
 
-    expected_0_3 = make_tree("((a,b),(((e,f),d),c))")
+    expected_0_3 = "((a,b),(((e,f),d),c))"
     got_0_3 = app_0_3(five_trees)
     assert tree_equal(got_0_3, expected_0_3)
 
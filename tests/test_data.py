@@ -1,33 +1,46 @@
 import pathlib
+from collections.abc import Iterator
+from typing import Any, cast
 
-from pytest_mock import MockerFixture
+import pytest
+import responses
 
 import piqtree
 
+FAKE_CONTENT = b"fake dataset data"
+
+
+@pytest.fixture(scope="module")
+def mock_download() -> Iterator[responses.RequestsMock]:
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            responses.GET,
+            piqtree._data._get_url("example.tree.gz"),
+            body=FAKE_CONTENT,
+        )
+        yield rsps
+
 
 def test_dataset_names() -> None:
     names = piqtree.dataset_names()
     assert len(names) > 0
 
 
-def test_download_dataset(tmp_path: pathlib.Path, mocker: MockerFixture) -> None:
-    # Mock the requests response
-    fake_content = b"fake dataset data"
-
-    mock_response = mocker.Mock()
-    mock_response.iter_content.return_value = [fake_content]
-    mocker.patch("piqtree._data.requests.get", return_value=mock_response)
-
+def test_download_dataset(
+    tmp_path: pathlib.Path,
+    mock_download: responses.RequestsMock,
+) -> None:
     dataset_name = "example.tree.gz"
     dest_path = piqtree.download_dataset(dataset_name, dest_dir=tmp_path)
 
     assert dest_path.exists()
-    assert dest_path.read_bytes() == fake_content
+    assert dest_path.read_bytes() == FAKE_CONTENT
 
     # Check correct arguments
-    expected_url = piqtree._data._get_url(dataset_name)
-    piqtree._data.requests.get.assert_called_once_with(  # type: ignore[attr-defined]
-        expected_url,
-        stream=True,
-        timeout=20,
-    )
+    assert len(mock_download.calls) == 1
+    request = mock_download.calls[0].request
+    assert request.url == piqtree._data._get_url(dataset_name)
+    # responses records the send() kwargs on the request, untyped
+    req_kwargs = cast("Any", request).req_kwargs
+    assert req_kwargs["stream"] is True
+    assert req_kwargs["timeout"] == 20
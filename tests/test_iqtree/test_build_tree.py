@@ -1,7 +1,8 @@
 import re
+from collections.abc import Sequence
 
 import pytest
-from cogent3 import make_tree
+from cogent3 import PhyloNode
 from cogent3.core.alignment import Alignment
 
 import piqtree
@@ -23,12 +24,11 @@ from piqtree.model import (
 
 def check_build_tree_model(
     aln: Alignment,
+    expected: PhyloNode,
     model: Model,
     *,
     coerce_str: bool = False,
 ) -> None:
-    expected = make_tree("(Human,Chimpanzee,(SpermWhale,HumpbackW));")
-
     got = piqtree.build_tree(aln, str(model) if coerce_str else model)
     # Check topology
     assert expected.same_topology(got.unrooted())
@@ -39,6 +39,7 @@ def check_build_tree_model(
 
 def check_build_tree(
     aln: Alignment,
+    expected: PhyloNode,
     dna_model: SubstitutionModel,
     freq_type: FreqType | CustomBaseFreq | None = None,
     rate_model: RateModel | None = None,
@@ -53,27 +54,64 @@ def check_build_tree(
         rate_model=rate_model,
     )
 
-    check_build_tree_model(aln, model, coerce_str=coerce_str)
+    check_build_tree_model(aln, expected, model, coerce_str=coerce_str)
+
+
+def _cover_each(
+    dna_models: Sequence[StandardDnaModel],
+    freq_types: list[FreqType],
+) -> list[tuple[StandardDnaModel, FreqType]]:
+    # every model and every frequency type appears in at least one case
+    num_cases = max(len(dna_models), len(freq_types))
+    return [
+        (dna_models[i % len(dna_models)], freq_types[i % len(freq_types)])
+        for i in range(num_cases)
+    ]
 
 
-@pytest.mark.parametrize("dna_model", StandardDnaModel.iter_available_models())
-@pytest.mark.parametrize("freq_type", list(FreqType))
+@pytest.mark.parametrize(
+    ("dna_model", "freq_type"),
+    _cover_each(StandardDnaModel.iter_available_models(), list(FreqType)),
+)
 def test_non_lie_build_tree(
     four_otu: Alignment,
+    four_otu_expected_topology: PhyloNode,
     dna_model: StandardDnaModel,
     freq_type: FreqType,
 ) -> None:
-    check_build_tree(four_otu, dna_model, freq_type)
+    check_build_tree(
+        four_otu,
+        four_otu_expected_topology,
+        dna_model,
+        freq_type,
+    )
 
 
 @pytest.mark.parametrize("lie_model", LieModel.iter_available_models())
-def test_lie_build_tree(four_otu: Alignment, lie_model: LieModelInstance) -> None:
-    check_build_tree(four_otu, lie_model)
+def test_lie_build_tree(
+    four_otu: Alignment,
+    four_otu_expected_topology: PhyloNode,
+    lie_model: LieModelInstance,
+) -> None:
+    check_build_tree(
+        four_otu,
+        four_otu_expected_topology,
+        lie_model,
+    )
 
 
 @pytest.mark.parametrize("lie_model", LieModel.iter_available_models()[:3])
-def test_str_build_tree(four_otu: Alignment, lie_model: LieModelInstance) -> None:
-    check_build_tree(four_otu, lie_model, coerce_str=True)
+def test_str_build_tree(
+    four_otu: Alignment,
+    four_otu_expected_topology: PhyloNode,
+    lie_model: LieModelInstance,
+) -> None:
+    check_build_tree(
+        four_otu,
+        four_otu_expected_topology,
+        lie_model,
+        coerce_str=True,
+    )
 
 
 @pytest.mark.parametrize("dna_model", StandardDnaModel.iter_available_models()[:3])
@@ -90,12 +128,14 @@ def test_str_build_tree(four_otu: Alignment, lie_model: LieModelInstance) -> Non
 )
 def test_rate_model_build_tree(
     four_otu: Alignment,
+    four_otu_expected_topology: PhyloNode,
     dna_model: StandardDnaModel,
     invariable_sites: bool,
     rate_model: RateModel,
 ) -> None:
     check_build_tree(
         four_otu,
+        four_otu_expected_topology,
         dna_model,
         rate_model=rate_model,
         invariable_sites=invariable_sites,
@@ -111,6 +151,7 @@ def test_build_tree_inadequate_bootstrapping(four_otu: Alignment) -> None:
         )
 
 
+@pytest.mark.slow
 def test_build_tree_bootstrapping(four_otu: Alignment) -> None:
     tree = piqtree.build_tree(
         four_otu,
@@ -130,9 +171,17 @@ def test_build_tree_bootstrapping(four_otu: Alignment) -> None:
         "WS3.3b{0.5,-0.2}+F{0.6,0.1,0.2,0.1}+I{0.1}",
     ],
 )
-def test_build_tree_paramaterisation(four_otu: Alignment, model_str: str) -> None:
+def test_build_tree_paramaterisation(
+    four_otu: Alignment,
+    four_otu_expected_topology: PhyloNode,
+    model_str: str,
+) -> None:
     model = make_model(model_str)
-    check_build_tree_model(four_otu, model)
+    check_build_tree_model(
+        four_otu,
+        four_otu_expected_topology,
+        model,
+    )
 
 
 def test_invalid_protein_base_freq(four_otu: Alignment) -> None:
@@ -1,10 +1,8 @@
-from cogent3.core.alignment import Alignment
+from cogent3.evolve.fast_distance import DistanceMatrix
 
-from piqtree import jc_distances
 
-
-def test_jc_distance(five_otu: Alignment) -> None:
-    dists = jc_distances(five_otu)
+def test_jc_distance(five_otu_jc: DistanceMatrix) -> None:
+    dists = five_otu_jc
 
     assert (
         0 < dists["Human", "Chimpanzee"] < dists["Human", "Dugong"]
@@ -1,10 +1,15 @@
+import functools
+import hashlib
+import os
+import pickle
 import re
-from typing import cast
+from collections.abc import Callable
+from typing import NamedTuple, cast
 
+import cogent3
 import numpy as np
 import pytest
 from cogent3 import get_app, make_tree
-from cogent3.app.result import model_result
 from cogent3.core.alignment import Alignment
 from cogent3.core.tree import PhyloNode
 
@@ -13,131 +18,188 @@ from piqtree.exceptions import IqTreeError
 from piqtree.model import Model, StandardDnaModel
 
 
+class ReferenceFit(NamedTuple):
+    """The parts of a cogent3 model fit the tests compare against."""
+
+    lnl: float
+    tree: PhyloNode
+
+
 def check_model_name(got: PhyloNode, expected: str) -> None:
     got_model = cast("str", got.params.get("model"))
     assert got_model == expected
 
 
-def check_likelihood(got: PhyloNode, expected: model_result) -> None:
-    assert got.params["lnL"] == pytest.approx(expected.lnL)
+def check_likelihood(got: PhyloNode, expected: ReferenceFit) -> None:
+    assert got.params["lnL"] == pytest.approx(expected.lnl)
 
 
 def check_motif_probs(got: PhyloNode, expected: PhyloNode) -> None:
     expected_mprobs = expected.params["mprobs"]
     got_mprobs = got.params["mprobs"]
 
-    expected_keys = set(expected_mprobs.keys())
-    got_keys = set(got_mprobs.keys())
+    expected_keys = tuple(sorted(expected_mprobs))
+    got_keys = tuple(sorted(got_mprobs))
 
     # Check that the base characters are the same
     assert expected_keys == got_keys
 
     # Check that the probs are the same
-    expected_values = [expected_mprobs[key] for key in expected_keys]
-    got_values = [got_mprobs[key] for key in expected_keys]
-    assert all(
-        got == pytest.approx(exp)
-        for got, exp in zip(got_values, expected_values, strict=True)
+    num_keys = len(expected_keys)
+    got_values = np.fromiter(
+        (got_mprobs[key] for key in expected_keys),
+        dtype=float,
+        count=num_keys,
     )
+    expected_values = np.fromiter(
+        (expected_mprobs[key] for key in expected_keys),
+        dtype=float,
+        count=num_keys,
+    )
+    # same tolerances as pytest.approx's defaults
+    np.testing.assert_allclose(got_values, expected_values, rtol=1e-6, atol=1e-12)
+
+
+_NON_RATE_PARAMS = frozenset({"length", "ENS", "paralinear", "mprobs"})
 
 
 def check_rate_parameters(got: PhyloNode, expected: PhyloNode) -> None:
     # Collect all rate parameters in got and expected
-    exclude = {"length", "ENS", "paralinear", "mprobs"}
-    expected_keys = {
-        k for k in expected.get_edge_vector()[0].params if k not in exclude
-    }
-    got_keys = {k for k in got.get_edge_vector()[0].params if k not in exclude}
+    expected_params = expected.get_edge_vector()[0].params
+    got_params = got.get_edge_vector()[0].params
+    expected_keys = tuple(sorted(expected_params.keys() - _NON_RATE_PARAMS))
+    got_keys = tuple(sorted(got_params.keys() - _NON_RATE_PARAMS))
 
     # Check that the keys of rate are the same
     assert expected_keys == got_keys
 
     # Check that the values of rate are the same
-    expected_values = [expected[0].params[key] for key in expected_keys]
-    got_values = [got[0].params[key] for key in expected_keys]
-
-    assert all(
-        got == pytest.approx(exp, rel=1e-2)
-        for got, exp in zip(got_values, expected_values, strict=True)
+    num_keys = len(expected_keys)
+    got_values = np.fromiter(
+        (got_params[key] for key in expected_keys),
+        dtype=float,
+        count=num_keys,
+    )
+    expected_values = np.fromiter(
+        (expected_params[key] for key in expected_keys),
+        dtype=float,
+        count=num_keys,
     )
+    np.testing.assert_allclose(got_values, expected_values, rtol=1e-2, atol=1e-12)
+
+
+@functools.cache
+def _reorder_perm(
+    names_from: tuple[str, ...],
+    names_to: tuple[str, ...],
+) -> np.ndarray:
+    index = {name: i for i, name in enumerate(names_from)}
+    return np.array([index[name] for name in names_to], dtype=np.intp)
 
 
 def check_branch_lengths(got: PhyloNode, expected: PhyloNode) -> None:
     got_dists = got.tip_to_tip_distances()
     expected_dists = expected.tip_to_tip_distances()
-    # make sure the distance matrices have the same name order
-    # so we can just compare entire numpy arrays
-    expected_dists = expected_dists.take_dists(got_dists.names)
     # Check that the keys of branch lengths are the same
     assert set(got_dists.names) == set(expected_dists.names)
 
+    # put the expected distances in the same name order
+    # so we can just compare entire numpy arrays
+    perm = _reorder_perm(tuple(expected_dists.names), tuple(got_dists.names))
+    expected_array = expected_dists.array[np.ix_(perm, perm)]
+
     # Check that the branch lengths are the same
-    np.testing.assert_allclose(got_dists.array, expected_dists.array, atol=1e-4)
+    np.testing.assert_allclose(got_dists.array, expected_array, atol=1e-4)
 
 
-@pytest.mark.parametrize(
-    ("iq_model", "c3_model"),
-    [
-        (StandardDnaModel.JC, "JC69"),
-        (StandardDnaModel.K80, "K80"),
-        (StandardDnaModel.GTR, "GTR"),
-        (StandardDnaModel.TN, "TN93"),
-        (StandardDnaModel.HKY, "HKY85"),
-        (StandardDnaModel.F81, "F81"),
-    ],
-)
-def test_fit_tree(
+MODEL_PAIRS = [
+    (StandardDnaModel.JC, "JC69"),
+    (StandardDnaModel.K80, "K80"),
+    (StandardDnaModel.GTR, "GTR"),
+    (StandardDnaModel.TN, "TN93"),
+    (StandardDnaModel.HKY, "HKY85"),
+    (StandardDnaModel.F81, "F81"),
+]
+
+
+@pytest.fixture(scope="session")
+def cogent3_expected(
+    request: pytest.FixtureRequest,
     three_otu: Alignment,
-    iq_model: StandardDnaModel,
-    c3_model: str,
-) -> None:
-    tree_topology = make_tree(tip_names=three_otu.names)
-    app = get_app("model", c3_model, tree=tree_topology)
-    expected = app(three_otu)
+    three_otu_topology: PhyloNode,
+) -> Callable[[str], ReferenceFit]:
+    # The cogent3 reference fits are deterministic, so persist them in the
+    # pytest cache and only refit when the inputs or cogent3 version change.
+    # Without the cacheprovider plugin (-p no:cacheprovider) fits stay in memory.
+    cache = getattr(request.config, "cache", None)
+    cache_dir = cache.mkdir("cogent3_ref") if cache is not None else None
+
+    def run_fit(c3_model: str) -> ReferenceFit:
+        app = get_app("model", c3_model, tree=three_otu_topology)
+        result = app(three_otu)
+        return ReferenceFit(result.lnL, result.tree)
+
+    @functools.cache
+    def fit(c3_model: str) -> ReferenceFit:
+        if cache_dir is None:
+            return run_fit(c3_model)
+
+        key = "\n".join(
+            (
+                cogent3.__version__,
+                c3_model,
+                three_otu.to_fasta(),
+                str(three_otu_topology),
+            ),
+        )
+        digest = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()
+        path = cache_dir / f"{c3_model}_{digest}.pkl"
+        if path.exists():
+            return cast("ReferenceFit", pickle.loads(path.read_bytes()))  # noqa: S301
 
-    model = Model(iq_model)
+        reference = run_fit(c3_model)
 
-    got = piqtree.fit_tree(three_otu, tree_topology, model)
-    check_likelihood(got, expected)
-    check_motif_probs(got, expected.tree)
-    check_rate_parameters(got, expected.tree)
-    check_branch_lengths(got, expected.tree)
-    check_model_name(got, str(model))
+        # write then rename, so parallel workers never read a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(pickle.dumps(reference))
+        tmp_path.replace(path)
+        return reference
 
+    return fit
 
-@pytest.mark.parametrize(
-    ("iq_model", "c3_model"),
-    [
-        (StandardDnaModel.JC, "JC69"),
-        (StandardDnaModel.K80, "K80"),
-        (StandardDnaModel.GTR, "GTR"),
-        (StandardDnaModel.TN, "TN93"),
-        (StandardDnaModel.HKY, "HKY85"),
-        (StandardDnaModel.F81, "F81"),
-    ],
-)
-def test_fit_tree_str_model(
+
+@pytest.mark.parametrize("coerce_str", [False, True])
+@pytest.mark.parametrize(("iq_model", "c3_model"), MODEL_PAIRS)
+def test_fit_tree(
     three_otu: Alignment,
     iq_model: StandardDnaModel,
     c3_model: str,
+    coerce_str: bool,
+    three_otu_topology: PhyloNode,
+    cogent3_expected: Callable[[str], ReferenceFit],
 ) -> None:
-    tree_topology = make_tree(tip_names=three_otu.names)
-    app = get_app("model", c3_model, tree=tree_topology)
-    expected = app(three_otu)
+    expected = cogent3_expected(c3_model)
 
-    model = str(Model(iq_model))
+    model = Model(iq_model)
 
-    got = piqtree.fit_tree(three_otu, tree_topology, model)
+    got = piqtree.fit_tree(
+        three_otu,
+        three_otu_topology,
+        str(model) if coerce_str else model,
+    )
     check_likelihood(got, expected)
     check_motif_probs(got, expected.tree)
     check_rate_parameters(got, expected.tree)
     check_branch_lengths(got, expected.tree)
+    check_model_name(got, str(model))
 
 
 def test_fit_tree_fixed_branch_length(
     three_otu: Alignment,
+    three_otu_topology: PhyloNode,
 ) -> None:
-    tree_topology: PhyloNode = make_tree(tip_names=three_otu.names)
+    # the lengths are set below, so work on a copy of the shared topology
+    tree_topology = three_otu_topology.deepcopy()
     lengths = (0.1, 0.2, 0.3)
     for i, node in enumerate(tree_topology.postorder(include_self=False)):
         node.length = lengths[i]
@@ -181,10 +243,12 @@ def test_fit_tree_fixed_branch_length(
         "WS3.3b{0.5,-0.2}+F{0.6,0.1,0.2,0.1}+I{0.1}",
     ],
 )
-def test_fit_tree_paramaterisation(three_otu: Alignment, model_str: str) -> None:
-    tree_topology = make_tree(tip_names=three_otu.names)
-
-    tree = piqtree.fit_tree(three_otu, tree_topology, model_str)
+def test_fit_tree_paramaterisation(
+    three_otu: Alignment,
+    three_otu_topology: PhyloNode,
+    model_str: str,
+) -> None:
+    tree = piqtree.fit_tree(three_otu, three_otu_topology, model_str)
 
     assert isinstance(tree.params["lnL"], float)
     for node in tree.preorder(include_self=False):
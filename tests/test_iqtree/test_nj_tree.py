@@ -5,15 +5,19 @@ import numpy as np
 import pytest
 from cogent3 import make_tree
 from cogent3.core.alignment import Alignment
+from cogent3.evolve.fast_distance import DistanceMatrix
 
 from piqtree import jc_distances, nj_tree
 
+_NAN_PATTERN = re.compile(
+    re.escape("The pairwise distance matrix cannot contain NaN values."),
+)
 
-def test_nj_tree(five_otu: Alignment) -> None:
+
+def test_nj_tree(five_otu_jc: DistanceMatrix) -> None:
     expected = make_tree("(((Human, Chimpanzee), Rhesus), Manatee, Dugong);")
 
-    dists = jc_distances(five_otu)
-    actual = nj_tree(dists)
+    actual = nj_tree(five_otu_jc)
 
     assert expected.same_topology(actual)
 
@@ -35,12 +39,16 @@ def test_nj_tree_allow_negative(all_otu: Alignment) -> None:
     )
 
 
-def test_nj_tree_nan(four_otu: Alignment) -> None:
-    dists = jc_distances(four_otu)
+def test_nj_tree_nan(five_otu_jc: DistanceMatrix) -> None:
+    # copy the shared matrix before adding the NaN
+    dists = DistanceMatrix.from_array_names(
+        five_otu_jc.array.copy(),
+        five_otu_jc.names,
+    )
     dists[1, 0] = dists[0, 1] = np.nan
 
     with pytest.raises(
         ValueError,
-        match=re.escape("The pairwise distance matrix cannot contain NaN values."),
+        match=_NAN_PATTERN,
     ):
         nj_tree(dists, allow_negative=True)
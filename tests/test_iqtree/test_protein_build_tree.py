@@ -10,6 +10,17 @@ from piqtree.model import (
     SubstitutionModel,
 )
 
+# a representative sample runs by default, the full matrix with --run-slow
+_FAST_AA_MODELS = frozenset({AaModel.WAG, AaModel.JTT, AaModel.LG})
+AA_MODEL_PARAMS = [
+    pytest.param(
+        aa_model,
+        marks=() if aa_model in _FAST_AA_MODELS else pytest.mark.slow,
+        id=aa_model.name,
+    )
+    for aa_model in AaModel.iter_available_models()
+]
+
 
 def check_build_tree_model(
     aln: Alignment,
@@ -32,12 +43,12 @@ def check_build_tree(
     check_build_tree_model(aln, model, coerce_str=coerce_str)
 
 
-@pytest.mark.parametrize("aa_model", AaModel.iter_available_models())
+@pytest.mark.parametrize("aa_model", AA_MODEL_PARAMS)
 def test_protein_build_tree(protein_four_otu: Alignment, aa_model: AaModel) -> None:
     check_build_tree(protein_four_otu, aa_model, coerce_str=True)
 
 
-@pytest.mark.parametrize("aa_model", AaModel.iter_available_models())
+@pytest.mark.parametrize("aa_model", AA_MODEL_PARAMS)
 def test_str_protein_build_tree(protein_four_otu: Alignment, aa_model: AaModel) -> None:
     check_build_tree(protein_four_otu, aa_model, coerce_str=False)
 
@@ -1,4 +1,5 @@
 import pytest
+from cogent3 import PhyloNode
 
 from piqtree import TreeGenMode, random_tree
 from piqtree.exceptions import IqTreeError
@@ -11,20 +12,22 @@ def test_random_tree(num_taxa: int, tree_mode: TreeGenMode) -> None:
     assert len(tree.tips()) == num_taxa
 
 
+def _signature(tree: PhyloNode) -> list[tuple[str, float | None, int]]:
+    return [(node.name, node.length, len(node.children)) for node in tree.postorder()]
+
+
 @pytest.mark.parametrize("rand_seed", [0, 1234])
 def test_random_tree_determinism(rand_seed: int) -> None:
     tree_1 = random_tree(10, TreeGenMode.YULE_HARDING, rand_seed=rand_seed)
     tree_2 = random_tree(10, TreeGenMode.YULE_HARDING, rand_seed=rand_seed)
 
-    for node_a, node_b in zip(tree_1.postorder(), tree_2.postorder(), strict=True):
-        assert node_a.name == node_b.name
-        assert node_a.length == node_b.length
-        assert len(node_a.children) == len(node_b.children)
+    assert _signature(tree_1) == _signature(tree_2)
 
 
-@pytest.mark.parametrize("num_taxa", [10, 50, 100])
 @pytest.mark.parametrize("tree_mode", list(TreeGenMode))
-def test_random_tree_no_seed(num_taxa: int, tree_mode: TreeGenMode) -> None:
+def test_random_tree_no_seed(tree_mode: TreeGenMode) -> None:
+    # tree sizes are covered by test_random_tree, this checks the unseeded path
+    num_taxa = 10
     tree = random_tree(num_taxa, tree_mode)
     assert len(tree.tips()) == num_taxa
 
@@ -8,8 +8,13 @@ from piqtree import TreeGenMode, build_tree, fit_tree, random_tree
 from piqtree.exceptions import IqTreeError
 from piqtree.model import DiscreteGammaModel, FreeRateModel, Model, StandardDnaModel
 
+# these tests probe IQ-TREE's global state, so keep them on one worker in order
+pytestmark = pytest.mark.xdist_group("iq_segfault")
 
-@pytest.fixture
+_JC_MODEL = Model(StandardDnaModel.JC)
+
+
+@pytest.fixture(scope="module")
 def tiny_alignment() -> Alignment:
     return make_aligned_seqs(
         {"a": "GGG", "b": "GGC", "c": "AAC", "d": "AAA"},
@@ -23,8 +28,8 @@ def test_two_build_random_tree(tiny_alignment: Alignment) -> None:
     used to result in a Segmentation Fault in a previous version.
     """
 
-    build_tree(tiny_alignment, Model(StandardDnaModel.JC), 1)
-    build_tree(tiny_alignment, Model(StandardDnaModel.JC), 2)
+    build_tree(tiny_alignment, _JC_MODEL, 1)
+    build_tree(tiny_alignment, _JC_MODEL, 2)
 
     with pytest.raises(IqTreeError):
         random_tree(2, TreeGenMode.BALANCED, 1)
@@ -37,8 +42,8 @@ def test_two_fit_random_tree(tiny_alignment: Alignment) -> None:
     """
     tree = make_tree("(a,b,(c,d));")
 
-    fit_tree(tiny_alignment, tree, Model(StandardDnaModel.JC))
-    fit_tree(tiny_alignment, tree, Model(StandardDnaModel.JC))
+    fit_tree(tiny_alignment, tree, _JC_MODEL)
+    fit_tree(tiny_alignment, tree, _JC_MODEL)
 
     with pytest.raises(IqTreeError):
         random_tree(2, TreeGenMode.BALANCED, 1)
@@ -55,14 +60,10 @@ def test_two_invalid_models(
     Calling build_tree multiple times with an invalid
     model has resulted in a Segmentation Fault.
     """
+    model = Model(StandardDnaModel.JC, rate_model=rate_model_class(categories))
+
     with pytest.raises(IqTreeError):
-        _ = build_tree(
-            tiny_alignment,
-            Model(StandardDnaModel.JC, rate_model=rate_model_class(categories)),
-        )
+        _ = build_tree(tiny_alignment, model)
 
     with pytest.raises(IqTreeError):
-        _ = build_tree(
-            tiny_alignment,
-            Model(StandardDnaModel.JC, rate_model=rate_model_class(categories)),
-        )
+        _ = build_tree(tiny_alignment, model)
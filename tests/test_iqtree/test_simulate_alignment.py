@@ -68,52 +68,54 @@ def check_simulate_alignment(
     return aln
 
 
-@pytest.mark.parametrize(
-    "model",
-    [
-        *StandardDnaModel.iter_available_models(),
-        *LieModel.iter_available_models(),
-        *AaModel.iter_available_models(),
-    ],
-)
+_ALL_MODELS = [
+    *StandardDnaModel.iter_available_models(),
+    *LieModel.iter_available_models(),
+    *AaModel.iter_available_models(),
+]
+SUPPORTED_MODELS = [m for m in _ALL_MODELS if m.base_model not in UNSUPPORTED_MODELS]
+UNSUPPORTED_LIE_MODELS = [m for m in _ALL_MODELS if m.base_model in UNSUPPORTED_MODELS]
+# each unsupported model paired with its expected error pattern
+_UNSUPPORTED_MODEL_PARAMS = [
+    pytest.param(
+        model,
+        re.compile(
+            re.escape(
+                f"Lie Model {cast('LieModel', model.base_model).value} is unsupported.",
+            ),
+        ),
+        id=model.iqtree_str(),
+    )
+    for model in UNSUPPORTED_LIE_MODELS
+]
+
+
+@pytest.mark.parametrize("model", SUPPORTED_MODELS)
 def test_rooted_tree(
     five_taxon_rooted_tree: PhyloNode,
     model: SubstitutionModel,
 ) -> None:
-    if model.base_model in UNSUPPORTED_MODELS:
-        with pytest.raises(
-            ValueError,
-            match=re.escape(
-                f"Lie Model {cast('LieModel', model.base_model).value} is unsupported.",
-            ),
-        ):
-            check_simulate_alignment(five_taxon_rooted_tree, Model(model))
-    else:
-        check_simulate_alignment(five_taxon_rooted_tree, Model(model))
+    check_simulate_alignment(five_taxon_rooted_tree, Model(model))
 
 
-@pytest.mark.parametrize(
-    "model",
-    [
-        *StandardDnaModel.iter_available_models(),
-        *LieModel.iter_available_models(),
-        *AaModel.iter_available_models(),
-    ],
-)
+@pytest.mark.parametrize("model", SUPPORTED_MODELS)
 def test_unrooted_tree(
     four_taxon_unrooted_tree: PhyloNode,
     model: SubstitutionModel,
 ) -> None:
-    if model.base_model in UNSUPPORTED_MODELS:
-        with pytest.raises(
-            ValueError,
-            match=re.escape(
-                f"Lie Model {cast('LieModel', model.base_model).value} is unsupported.",
-            ),
-        ):
-            check_simulate_alignment(four_taxon_unrooted_tree, Model(model))
-    else:
-        check_simulate_alignment(four_taxon_unrooted_tree, Model(model))
+    check_simulate_alignment(four_taxon_unrooted_tree, Model(model))
+
+
+@pytest.mark.parametrize(("model", "pattern"), _UNSUPPORTED_MODEL_PARAMS)
+def test_unsupported_model(
+    five_taxon_rooted_tree: PhyloNode,
+    four_taxon_unrooted_tree: PhyloNode,
+    model: SubstitutionModel,
+    pattern: re.Pattern[str],
+) -> None:
+    for tree in (five_taxon_rooted_tree, four_taxon_unrooted_tree):
+        with pytest.raises(ValueError, match=pattern):
+            check_simulate_alignment(tree, Model(model))
 
 
 @pytest.mark.parametrize("length", [None, 500, 1500])
@@ -144,19 +146,45 @@ def test_indel_rates(
 
 
 @pytest.mark.parametrize(
-    "indel_size_distributions",
+    ("indel_size_distributions", "expected_strs"),
     [
-        (IndelGeometric(5), IndelGeometric(4)),
-        (IndelNegativeBinomial(5, 20), IndelZipfian(1.5, 10)),
-        (IndelLavalette(1.5, 10), IndelLavalette(1.5, 10)),
+        ((IndelGeometric(5), IndelGeometric(4)), ("GEO{5}", "GEO{4}")),
+        (
+            (IndelNegativeBinomial(5, 20), IndelZipfian(1.5, 10)),
+            ("NB{5/20}", "POW{1.5/10}"),
+        ),
+        (
+            (IndelLavalette(1.5, 10), IndelLavalette(1.5, 10)),
+            ("LAV{1.5/10}", "LAV{1.5/10}"),
+        ),
     ],
 )
 def test_indel_sizes(
     four_taxon_unrooted_tree: PhyloNode,
-    indel_size_distributions: tuple[IndelDistribution | str, IndelDistribution | str],
+    indel_size_distributions: tuple[IndelDistribution, IndelDistribution],
+    expected_strs: tuple[str, str],
 ) -> None:
-    insertion_size_distribution = indel_size_distributions[0]
-    deletion_size_distribution = indel_size_distributions[1]
+    insertion_size_distribution, deletion_size_distribution = indel_size_distributions
+
+    assert str(insertion_size_distribution) == expected_strs[0]
+    assert str(deletion_size_distribution) == expected_strs[1]
+
+    check_simulate_alignment(
+        four_taxon_unrooted_tree,
+        "GTR{1.0,2.0,1.5,3.7,2.8}+F{0.1,0.2,0.3,0.4}",
+        insertion_rate=0.1,
+        deletion_rate=0.05,
+        insertion_size_distribution=insertion_size_distribution,
+        deletion_size_distribution=deletion_size_distribution,
+        seed=1,
+    )
+
+
+def test_indel_sizes_str(four_taxon_unrooted_tree: PhyloNode) -> None:
+    # the string form of a distribution simulates the same as the object
+    insertion_size_distribution = IndelNegativeBinomial(5, 20)
+    deletion_size_distribution = IndelZipfian(1.5, 10)
+
     aln = check_simulate_alignment(
         four_taxon_unrooted_tree,
         "GTR{1.0,2.0,1.5,3.7,2.8}+F{0.1,0.2,0.3,0.4}",
@@ -172,8 +200,8 @@ def test_indel_sizes(
         "GTR{1.0,2.0,1.5,3.7,2.8}+F{0.1,0.2,0.3,0.4}",
         insertion_rate=0.1,
         deletion_rate=0.05,
-        insertion_size_distribution=str(insertion_size_distribution),
-        deletion_size_distribution=str(deletion_size_distribution),
+        insertion_size_distribution="NB{5/20}",
+        deletion_size_distribution="POW{1.5/10}",
         seed=1,
     )
 
@@ -8,6 +8,10 @@ from piqtree import make_model
 from piqtree.exceptions import ParseIqTreeError
 from piqtree.iqtree._tree import _process_tree_yaml, _tree_equal
 
+_MOTIF_ABSENT_PATTERN = re.compile(
+    re.escape("IQ-TREE output is malformed, motif parameters not found."),
+)
+
 
 @pytest.fixture
 def newick_not_in_candidates() -> list[dict[str, Any]]:
@@ -208,7 +212,7 @@ def test_non_lie_dna_model_motif_absent(
     non_lie_dna_with_rate_model["ModelDNA"].pop("state_freq")
     with pytest.raises(
         ParseIqTreeError,
-        match=re.escape("IQ-TREE output is malformed, motif parameters not found."),
+        match=_MOTIF_ABSENT_PATTERN,
     ):
         _ = _process_tree_yaml(
             non_lie_dna_with_rate_model,
@@ -250,7 +254,7 @@ def test_lie_dna_model_motif_absent(
     lie_dna_model["ModelLieMarkovRY2.2b"].pop("state_freq")
     with pytest.raises(
         ParseIqTreeError,
-        match=re.escape("IQ-TREE output is malformed, motif parameters not found."),
+        match=_MOTIF_ABSENT_PATTERN,
     ):
         _ = _process_tree_yaml(
             lie_dna_model,
@@ -4,10 +4,15 @@ from collections.abc import Sequence
 import pytest
 
 from piqtree.model import CustomBaseFreq, FreqType, get_freq_type
+from piqtree.model._freq_type import _FREQ_TYPE_DESCRIPTIONS
+
+_EMPTY_STR_PATTERN = re.compile(
+    re.escape("An empty string does not specify base frequencies."),
+)
 
 
 def test_number_of_descriptions() -> None:
-    assert len(FreqType) == len(FreqType._descriptions())
+    assert len(FreqType) == len(_FREQ_TYPE_DESCRIPTIONS)
 
 
 def test_descriptions_exist() -> None:
@@ -83,7 +88,7 @@ def test_invalid_freq_type_params(freqs: Sequence[float]) -> None:
 def test_custom_empty_str() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape("An empty string does not specify base frequencies."),
+        match=_EMPTY_STR_PATTERN,
     ):
         _ = CustomBaseFreq.from_str("")
 
@@ -99,8 +104,8 @@ def test_custom_bad_start() -> None:
         _ = CustomBaseFreq.from_str(base_freq_str)
 
 
-def test_custom_missing_bracket() -> None:
-    base_freq_str = "F{0.1,0.2,0.3,0.4"
+@pytest.mark.parametrize("base_freq_str", ["F{0.1,0.2,0.3,0.4", "F"])
+def test_custom_missing_bracket(base_freq_str: str) -> None:
     with pytest.raises(
         ValueError,
         match=re.escape(
@@ -1,3 +1,4 @@
+import itertools
 import re
 
 import pytest
@@ -16,6 +17,34 @@ from piqtree.model import (
     make_model,
 )
 
+_INVARIANT_PATTERN = re.compile(r"\+I\{\d+(\.\d+)?\}")
+_GAMMA_PATTERN = re.compile(r"\+G\d*\{\d+(\.\d+)?\}")
+_FREE_RATE_PATTERN = re.compile(r"\+R\d*\{\d+(\.\d+)?(,\d+(\.\d+)?)*\}")
+_CUSTOM_FREQ_PATTERN = re.compile(r"\+F\{\d+(\.\d+)?(,\d+(\.\d+)?)*\}")
+
+_UNKNOWN_SUB_MODEL_PATTERN = re.compile(re.escape("Unknown substitution model: 'GYR'"))
+_MULTIPLE_FREQ_PATTERN = re.compile(
+    re.escape("Model 'GTR+FO+FO' contains multiple base frequency specifications."),
+)
+_MULTIPLE_INVAR_PATTERN = re.compile(
+    re.escape("Model 'GTR+I+I' contains multiple specifications for invariable sites."),
+)
+_MULTIPLE_RATE_HET_PATTERN = re.compile(
+    re.escape("Model 'GTR+G+R' contains multiple rate heterogeneity specifications."),
+)
+_UNEXPECTED_COMPONENT_PATTERN = re.compile(
+    re.escape("Model 'GTR+Z' contains unexpected component."),
+)
+_MISSING_CLOSE_BRACKET_PATTERN = re.compile(
+    re.escape("Invalid specification for proportion of invariable sites, got 'I{0.5'."),
+)
+_MISSING_OPEN_BRACKET_PATTERN = re.compile(
+    re.escape("Invalid specification for proportion of invariable sites, got 'I0.3}'."),
+)
+_INVALID_PROPORTION_PATTERN = re.compile(
+    re.escape("Failed to read proportion of invariable sites, got 'I{cat}'"),
+)
+
 
 def check_make_model(
     sub_mod: SubstitutionModel,
@@ -33,7 +62,7 @@ def check_make_model(
     assert (invariable_sites is not False) == model.invariable_sites
 
     if not isinstance(invariable_sites, bool):
-        assert re.search(r"\+I\{\d+(\.\d+)?\}", expected)
+        assert _INVARIANT_PATTERN.search(expected)
         assert model.proportion_invariable_sites == invariable_sites
         assert model.invariable_sites
     else:
@@ -45,7 +74,7 @@ def check_make_model(
         assert isinstance(model.rate_model, DiscreteGammaModel)
         assert "+G" in expected
         if rate_model.alpha is not None:
-            assert re.search(r"\+G\d*\{\d+(\.\d+)?\}", expected)
+            assert _GAMMA_PATTERN.search(expected)
     else:
         assert not isinstance(model.rate_model, DiscreteGammaModel)
         assert "+G" not in expected
@@ -54,7 +83,7 @@ def check_make_model(
         assert isinstance(model.rate_model, FreeRateModel)
         assert "+R" in expected
         if rate_model.rates is not None:
-            assert re.search(r"\+R\d*\{\d+(\.\d+)?(,\d+(\.\d+)?)*\}", expected)
+            assert _FREE_RATE_PATTERN.search(expected)
     else:
         assert not isinstance(model.rate_model, FreeRateModel)
         assert "+R" not in expected
@@ -62,7 +91,7 @@ def check_make_model(
     if freq_type is not None:
         assert "+F" in expected
         if isinstance(freq_type, CustomBaseFreq):
-            assert re.search(r"\+F\{\d+(\.\d+)?(,\d+(\.\d+)?)*\}", expected)
+            assert _CUSTOM_FREQ_PATTERN.search(expected)
     else:
         assert "+F" not in expected
 
@@ -146,29 +175,47 @@ def test_make_model_rate_model(
     check_make_model(sub_mod, rate_model=rate_model)
 
 
+_COMBINED_SUB_MODS = [
+    *StandardDnaModel.iter_available_models()[:3],
+    StandardDnaModel.GTR([1.0, 2.0, 1.5, 3.7, 2.8]),
+    *LieModel.iter_available_models()[:3],
+    *AaModel.iter_available_models()[:3],
+]
+_COMBINED_FREQ_TYPES = [None, FreqType.FQ, CustomBaseFreq([0.1, 0.2, 0.3, 0.4])]
+_COMBINED_INVARIABLE_SITES = [False, 0.2, True]
+_COMBINED_RATE_MODELS = [
+    None,
+    DiscreteGammaModel(6),
+    DiscreteGammaModel(2, 0.3),
+    FreeRateModel(),
+    FreeRateModel(2, [0.4, 0.6], [0.9, 0.1]),
+]
+
+
+def _combined_cases() -> list[
+    tuple[
+        SubstitutionModel,
+        FreqType | CustomBaseFreq | None,
+        bool | float,
+        RateModel | None,
+    ]
+]:
+    # every combination of the model components, cycling through the
+    # substitution models so each one is also covered
+    components = itertools.product(
+        _COMBINED_FREQ_TYPES,
+        _COMBINED_INVARIABLE_SITES,
+        _COMBINED_RATE_MODELS,
+    )
+    return [
+        (_COMBINED_SUB_MODS[i % len(_COMBINED_SUB_MODS)], *component)
+        for i, component in enumerate(components)
+    ]
+
+
 @pytest.mark.parametrize(
-    "sub_mod",
-    [
-        *StandardDnaModel.iter_available_models()[:3],
-        StandardDnaModel.GTR([1.0, 2.0, 1.5, 3.7, 2.8]),
-        *LieModel.iter_available_models()[:3],
-        *AaModel.iter_available_models()[:3],
-    ],
-)
-@pytest.mark.parametrize(
-    "freq_type",
-    [None, FreqType.FQ, CustomBaseFreq([0.1, 0.2, 0.3, 0.4])],
-)
-@pytest.mark.parametrize("invariable_sites", [False, 0.2, True])
-@pytest.mark.parametrize(
-    "rate_model",
-    [
-        None,
-        DiscreteGammaModel(6),
-        DiscreteGammaModel(2, 0.3),
-        FreeRateModel(),
-        FreeRateModel(2, [0.4, 0.6], [0.9, 0.1]),
-    ],
+    ("sub_mod", "freq_type", "invariable_sites", "rate_model"),
+    _combined_cases(),
 )
 def test_make_model(
     sub_mod: SubstitutionModel,
@@ -179,6 +226,14 @@ def test_make_model(
     check_make_model(sub_mod, freq_type, rate_model, invariable_sites=invariable_sites)
 
 
+def test_make_model_returns_new_instance() -> None:
+    first = make_model("GTR+FO+I+R3")
+    second = make_model("GTR+FO+I+R3")
+    assert first is not second
+    assert first.rate_type is not second.rate_type
+    assert str(first) == str(second)
+
+
 def test_model_repr() -> None:
     model = make_model("GTR")
     assert repr(model) == "Model(submod_type=GTR, freq_type=None, rate_type=None)"
@@ -196,7 +251,7 @@ def test_model_repr() -> None:
 def test_bad_sub_model() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape("Unknown substitution model: 'GYR'"),
+        match=_UNKNOWN_SUB_MODEL_PATTERN,
     ):
         make_model("GYR")
 
@@ -204,9 +259,7 @@ def test_bad_sub_model() -> None:
 def test_multiple_freq_type() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape(
-            "Model 'GTR+FO+FO' contains multiple base frequency specifications.",
-        ),
+        match=_MULTIPLE_FREQ_PATTERN,
     ):
         make_model("GTR+FO+FO")
 
@@ -214,9 +267,7 @@ def test_multiple_freq_type() -> None:
 def test_multiple_invariable_sites() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape(
-            "Model 'GTR+I+I' contains multiple specifications for invariable sites.",
-        ),
+        match=_MULTIPLE_INVAR_PATTERN,
     ):
         make_model("GTR+I+I")
 
@@ -224,9 +275,7 @@ def test_multiple_invariable_sites() -> None:
 def test_multiple_rate_het() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape(
-            "Model 'GTR+G+R' contains multiple rate heterogeneity specifications.",
-        ),
+        match=_MULTIPLE_RATE_HET_PATTERN,
     ):
         make_model("GTR+G+R")
 
@@ -234,9 +283,7 @@ def test_multiple_rate_het() -> None:
 def test_unexpected_component() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape(
-            "Model 'GTR+Z' contains unexpected component.",
-        ),
+        match=_UNEXPECTED_COMPONENT_PATTERN,
     ):
         make_model("GTR+Z")
 
@@ -244,17 +291,13 @@ def test_unexpected_component() -> None:
 def test_missing_invar_brackets() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape(
-            "Invalid specification for proportion of invariable sites, got 'I{0.5'.",
-        ),
+        match=_MISSING_CLOSE_BRACKET_PATTERN,
     ):
         _ = make_model("GTR+I{0.5")
 
     with pytest.raises(
         ValueError,
-        match=re.escape(
-            "Invalid specification for proportion of invariable sites, got 'I0.3}'.",
-        ),
+        match=_MISSING_OPEN_BRACKET_PATTERN,
     ):
         _ = make_model("GTR+I0.3}")
 
@@ -262,6 +305,6 @@ def test_missing_invar_brackets() -> None:
 def test_invar_invalid_proportion() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape("Failed to read proportion of invariable sites, got 'I{cat}'"),
+        match=_INVALID_PROPORTION_PATTERN,
     ):
         _ = make_model("HKY+I{cat}")
@@ -10,6 +10,19 @@ from piqtree.model import (
     get_rate_type,
 )
 
+_GAMMA_EMPTY_STR_PATTERN = re.compile(
+    re.escape("An empty string is not a DiscreteGammaModel."),
+)
+_FREE_EMPTY_STR_PATTERN = re.compile(
+    re.escape("An empty string is not a FreeRateModel."),
+)
+_INVARIANT_RANGE_PATTERN = re.compile(
+    re.escape("The proportion of invariant sites must be in the range [0,1)"),
+)
+_RATES_AND_WEIGHTS_PATTERN = re.compile(
+    re.escape("Must specify both rates and weights or neither."),
+)
+
 
 def test_rate_model_uninstantiable() -> None:
     with pytest.raises(TypeError):
@@ -121,7 +134,7 @@ def test_invalid_rate_model_type(
 def test_discrete_empty_str() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape("An empty string is not a DiscreteGammaModel."),
+        match=_GAMMA_EMPTY_STR_PATTERN,
     ):
         _ = DiscreteGammaModel.from_str("")
 
@@ -130,9 +143,7 @@ def test_bad_invariable_sites() -> None:
     for invar_p in (1, 1.5, -0.3):
         with pytest.raises(
             ValueError,
-            match=re.escape(
-                "The proportion of invariant sites must be in the range [0,1)",
-            ),
+            match=_INVARIANT_RANGE_PATTERN,
         ):
             _ = RateType(invariable_sites=invar_p)
 
@@ -171,7 +182,7 @@ def test_discrete_bad_parameter() -> None:
 def test_free_empty_str() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape("An empty string is not a FreeRateModel."),
+        match=_FREE_EMPTY_STR_PATTERN,
     ):
         _ = FreeRateModel.from_str("")
 
@@ -226,7 +237,7 @@ def test_free_bad_number_of_parameters() -> None:
 def test_free_missing_rates() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape("Must specify both rates and weights or neither."),
+        match=_RATES_AND_WEIGHTS_PATTERN,
     ):
         _ = FreeRateModel(2, weights=[0.3, 0.7])
 
@@ -234,7 +245,7 @@ def test_free_missing_rates() -> None:
 def test_free_missing_weights() -> None:
     with pytest.raises(
         ValueError,
-        match=re.escape("Must specify both rates and weights or neither."),
+        match=_RATES_AND_WEIGHTS_PATTERN,
     ):
         _ = FreeRateModel(3, rates=[0.3, 0.4, 0.3])
 
@@ -6,19 +6,49 @@ import pytest
 from piqtree.model import (
     AaModel,
     LieModel,
+    LieModelInstance,
     Model,
     StandardDnaModel,
     StandardDnaModelInstance,
     SubstitutionModel,
     get_substitution_model,
 )
+from piqtree.model._substitution_model import (
+    _AA_MODEL_DESCRIPTIONS,
+    _STANDARD_DNA_MODEL_DESCRIPTIONS,
+)
 
+# each malformed model string paired with its expected error pattern
+_INVALID_PARAMETERISATION_PARAMS = [
+    pytest.param(
+        model,
+        re.compile(re.escape(f"Invalid parameterisation of {model!r}")),
+        id=model,
+    )
+    for model in ("GTR{1{2}", "GTR{1,2}}", "WS6.6{0.1}{0.2}")
+]
+_STRAY_CLOSING_BRACKET_PARAMS = [
+    pytest.param(
+        model,
+        re.compile(re.escape(f"Unknown substitution model: {model!r}")),
+        id=model,
+    )
+    for model in ("GTR}", "JC}", "WS6.6}")
+]
 
-@pytest.mark.parametrize("model_class", [StandardDnaModel, AaModel])
+
+@pytest.mark.parametrize(
+    ("model_class", "descriptions"),
+    [
+        (StandardDnaModel, _STANDARD_DNA_MODEL_DESCRIPTIONS),
+        (AaModel, _AA_MODEL_DESCRIPTIONS),
+    ],
+)
 def test_number_of_descriptions(
     model_class: type[StandardDnaModel] | type[AaModel],
+    descriptions: dict[SubstitutionModel, str],
 ) -> None:
-    assert len(model_class) == len(model_class._descriptions())
+    assert len(model_class) == len(descriptions)
 
 
 @pytest.mark.parametrize("model_class", [StandardDnaModel, AaModel])
@@ -77,8 +107,18 @@ def test_model_params(model_str: str, params: Sequence[float]) -> None:
     assert model.iqtree_str() == iqtree_str
     assert isinstance(model, StandardDnaModelInstance)
     assert model.model_params is not None
-    for model_param, param in zip(model.model_params, params, strict=True):
-        assert model_param == param
+    assert tuple(model.model_params) == tuple(params)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [StandardDnaModel.GTR([1.0, 2.0, 1.5]), LieModel.LIE_5_6a("WS", [0.2, -0.1])],
+)
+def test_list_params_hashable(
+    model: StandardDnaModelInstance | LieModelInstance,
+) -> None:
+    assert isinstance(model.model_params, tuple)
+    assert len({model, model}) == 1
 
 
 def test_missing_bracket() -> None:
@@ -90,6 +130,19 @@ def test_missing_bracket() -> None:
         _ = get_substitution_model(model)
 
 
+@pytest.mark.parametrize(("model", "pattern"), _INVALID_PARAMETERISATION_PARAMS)
+def test_invalid_parameterisation(model: str, pattern: re.Pattern[str]) -> None:
+    with pytest.raises(ValueError, match=pattern):
+        _ = get_substitution_model(model)
+
+
+@pytest.mark.parametrize(("model", "pattern"), _STRAY_CLOSING_BRACKET_PARAMS)
+def test_stray_closing_bracket(model: str, pattern: re.Pattern[str]) -> None:
+    # without an opening bracket there is no parameterisation to blame
+    with pytest.raises(ValueError, match=pattern):
+        _ = get_substitution_model(model)
+
+
 @pytest.mark.parametrize(
     "submod_type",
     ["FQ", "F", "+GTR", "AA", "G8", ""],